@@ -5,22 +5,26 @@ Exposes orchestrator state, forecast data, sensor data, and logs to the frontend
 
 from __future__ import annotations
 
-import json
+import bisect
 import os
+import re
 import sys
 import importlib.util
 import io
 import contextlib
+import functools
+import operator
+from collections import deque
 from datetime import datetime, timezone, timedelta
 import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from dotenv import load_dotenv
 from crewai import Crew, Process
 
 from respiro.data import SFDatasetBuilder
@@ -31,11 +35,8 @@ from respiro.tools.route_service import RouteIntelligenceService
 from respiro.integrations.purpleair import PurpleAirClient
 from respiro.tools.sf_routing_engine import pm25_to_aqi
 
-# Load environment variables
+# .env is loaded once when respiro.config.settings is imported above
 project_root = Path(__file__).parent
-env_path = project_root / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
 
 # Configuration
 FORECAST_OUTPUT_DIR = os.getenv("FORECAST_OUTPUT_DIR", str(project_root / "forecast-agent" / "output"))
@@ -251,12 +252,26 @@ def read_forecast_data() -> dict[str, Any] | None:
         return None
     
     try:
-        with open(forecast_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return orjson.loads(forecast_file.read_bytes())
+    except (orjson.JSONDecodeError, IOError):
         return None
 
 
+# "[timestamp] [LEVEL] message" in one pass; the level bracket is optional
+_LOG_LINE_PATTERN = re.compile(
+    r"\[(?P<timestamp>[^\]]*)\](?:[^\[]*\[(?P<level>[^\]]*)\])?(?P<message>.*)",
+    re.DOTALL,
+)
+
+# Map log levels to frontend types
+_LOG_LEVEL_MAPPING = {
+    "INFO": "info",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "SUCCESS": "success"
+}
+
+
 def get_recent_logs(limit: int = 50) -> list[dict[str, Any]]:
     """
     Read recent log entries from orchestrator log file.
@@ -277,45 +292,24 @@ def get_recent_logs(limit: int = 50) -> list[dict[str, Any]]:
     logs = []
     try:
         with open(log_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            # Read last N lines
-            for line in lines[-limit:]:
+            # Keep only the last N lines instead of materializing the whole file;
+            # non-positive limits fall back to the original lines[-limit:] slice.
+            lines = deque(f, maxlen=limit) if limit > 0 else f.readlines()[-limit:]
+            for line in lines:
                 line = line.strip()
                 if not line:
                     continue
                 
                 # Parse log format: [timestamp] [LEVEL] message
                 try:
-                    if line.startswith("[") and "]" in line:
-                        # Extract timestamp
-                        timestamp_end = line.find("]", 1)
-                        if timestamp_end > 0:
-                            timestamp_str = line[1:timestamp_end]
-                            
-                            # Extract level
-                            level_start = line.find("[", timestamp_end + 1)
-                            level_end = line.find("]", level_start + 1) if level_start > 0 else -1
-                            level = "INFO"
-                            message = line[level_end + 1:].strip() if level_end > 0 else line[timestamp_end + 1:].strip()
-                            
-                            if level_start > 0 and level_end > 0:
-                                level = line[level_start + 1:level_end]
-                                message = line[level_end + 1:].strip()
-                            
-                            # Map log levels to frontend types
-                            level_mapping = {
-                                "INFO": "info",
-                                "WARNING": "warning",
-                                "ERROR": "error",
-                                "SUCCESS": "success"
-                            }
-                            mapped_level = level_mapping.get(level.upper(), "info")
-                            
-                            logs.append({
-                                "timestamp": timestamp_str,
-                                "level": mapped_level,
-                                "message": message
-                            })
+                    match = _LOG_LINE_PATTERN.match(line)
+                    if match:
+                        level = match.group("level") or "INFO"
+                        logs.append({
+                            "timestamp": match.group("timestamp"),
+                            "level": _LOG_LEVEL_MAPPING.get(level.upper(), "info"),
+                            "message": match.group("message").strip()
+                        })
                 except Exception:
                     # If parsing fails, include raw line
                     logs.append({
@@ -329,6 +323,17 @@ def get_recent_logs(limit: int = 50) -> list[dict[str, Any]]:
     return logs[-limit:]
 
 
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing "Z" for UTC."""
+    try:
+        # Python 3.11+ handles "Z" natively, so the common case needs no str.replace copy
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if "Z" not in value:
+            raise
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def get_orchestrator_state() -> dict[str, Any]:
     """
     Get current orchestrator state from log files.
@@ -350,28 +355,15 @@ def get_orchestrator_state() -> dict[str, Any]:
     for log_entry in reversed(logs):  # Start from most recent
         message = log_entry.get("message", "")
         
+        # Extract timestamp from message (the matched phrase guarantees an "at")
         if "SensorIngestAgent completed at" in message:
-            # Extract timestamp from message
-            if "at" in message:
-                try:
-                    timestamp_str = message.split("at")[-1].strip()
-                    state["last_ingestion_timestamp"] = timestamp_str
-                except Exception:
-                    pass
+            state["last_ingestion_timestamp"] = message.split("at")[-1].strip()
         
         elif "ForecastAgent completed at" in message:
-            try:
-                timestamp_str = message.split("at")[-1].strip()
-                state["last_forecast_timestamp"] = timestamp_str
-            except Exception:
-                pass
+            state["last_forecast_timestamp"] = message.split("at")[-1].strip()
         
         elif "Starting orchestrator cycle at" in message:
-            try:
-                timestamp_str = message.split("at")[-1].strip()
-                state["last_cycle_timestamp"] = timestamp_str
-            except Exception:
-                pass
+            state["last_cycle_timestamp"] = message.split("at")[-1].strip()
         
         elif "Cycle completed in" in message:
             try:
@@ -385,7 +377,7 @@ def get_orchestrator_state() -> dict[str, Any]:
     if state["last_cycle_timestamp"]:
         # Check if cycle was recent (within last hour)
         try:
-            last_cycle = datetime.fromisoformat(state["last_cycle_timestamp"].replace("Z", "+00:00"))
+            last_cycle = _parse_iso_datetime(state["last_cycle_timestamp"])
             now = datetime.now(tz=timezone.utc)
             hours_since_cycle = (now - last_cycle).total_seconds() / 3600
             
@@ -401,6 +393,14 @@ def get_orchestrator_state() -> dict[str, Any]:
     return state
 
 
+_CPCB_TIMESTAMP_FORMATS = {
+    ("-", 2): "%d-%m-%Y %H:%M:%S",
+    ("-", 1): "%d-%m-%Y %H:%M",
+    ("/", 2): "%d/%m/%Y %H:%M:%S",
+    ("/", 1): "%d/%m/%Y %H:%M",
+}
+
+
 def _normalize_timestamp(timestamp: Any) -> str | None:
     """Normalize various timestamp formats into ISO 8601 string."""
     if timestamp is None:
@@ -419,28 +419,93 @@ def _normalize_timestamp(timestamp: Any) -> str | None:
 
     # Already ISO formatted?
     try:
-        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        dt = _parse_iso_datetime(ts_str)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
     except ValueError:
         pass
 
-    # Known CPCB formats (e.g., "14-11-2025 08:00:00")
-    known_formats = (
-        "%d-%m-%Y %H:%M:%S",
-        "%d-%m-%Y %H:%M",
-        "%d/%m/%Y %H:%M:%S",
-        "%d/%m/%Y %H:%M",
-    )
-    for fmt in known_formats:
-        try:
-            dt = datetime.strptime(ts_str, fmt).replace(tzinfo=timezone.utc)
-            return dt.isoformat().replace("+00:00", "Z")
-        except ValueError:
-            continue
+    # Known CPCB formats (e.g., "14-11-2025 08:00:00"). The date separator and
+    # the colon count pick the only format that can match, so strptime (regex
+    # based) runs once instead of failing through the candidates.
+    fmt = _CPCB_TIMESTAMP_FORMATS.get(("/" if "/" in ts_str else "-", ts_str.count(":")))
+    if fmt is None:
+        return None
+    try:
+        dt = datetime.strptime(ts_str, fmt).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return dt.isoformat().replace("+00:00", "Z")
 
-    return None
+
+@functools.lru_cache(maxsize=1)
+def _sensor_s3_client() -> Any:
+    """Return a process-wide boto3 S3 client (model loading is paid once)."""
+    import boto3
+    from botocore.config import Config
+
+    config = Config(retries={"max_attempts": 3, "mode": "adaptive"}, tcp_keepalive=True)
+    return boto3.session.Session().client("s3", config=config)
+
+
+# Latest sensor object per (bucket, prefix): (key, etag, fetched_at, parsed result).
+# Within the TTL nothing goes over the wire; after it, an unchanged object is
+# revalidated with a conditional GET instead of being downloaded again.
+SENSOR_DATA_CACHE_TTL_SECONDS = float(os.getenv("SENSOR_DATA_CACHE_TTL_SECONDS", "60"))
+_sensor_data_cache: dict[tuple[str, str], tuple[str, str, float, Any]] = {}
+
+
+def _is_not_modified(error: Exception) -> bool:
+    response = getattr(error, "response", None) or {}
+    code = str(response.get("Error", {}).get("Code", ""))
+    return code in ("304", "NotModified") or response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304
+
+
+# Ingest objects are named data/aqi_data_YYYYMMDD_HHMMSS.json, so key order is time order
+SENSOR_DATA_KEY_PREFIX = "data/aqi_data_"
+# Only keys that follow the dated naming are ordered by key; anything else under the
+# prefix (e.g. data/aqi_data_latest.json) would otherwise sort after every date.
+_DATED_SENSOR_KEY_PATTERN = re.compile(r"data/aqi_data_\d{8}_\d{6}\.json")
+_object_key = operator.itemgetter("Key")
+_object_last_modified = operator.itemgetter("LastModified")
+
+
+def _latest_sensor_object_key(s3_client: Any, bucket_name: str, prefix: str) -> str | None:
+    """Return the newest sensor object key, listing only today's keys when possible."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    today = datetime.now(tz=timezone.utc).strftime("%Y%m%d")
+    
+    # A single list_objects_v2 call stops at 1000 keys, so walk every page and
+    # keep a running max rather than collecting and sorting the whole listing.
+    latest = None
+    for page in paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=SENSOR_DATA_KEY_PREFIX,
+        StartAfter=f"{SENSOR_DATA_KEY_PREFIX}{today}",
+    ):
+        dated = [obj for obj in page.get("Contents", ()) if _DATED_SENSOR_KEY_PATTERN.fullmatch(obj["Key"])]
+        if dated:
+            page_latest = max(dated, key=_object_key)
+            if latest is None or page_latest["Key"] > latest["Key"]:
+                latest = page_latest
+    if latest is not None:
+        return latest["Key"]
+    
+    # Nothing dated ingested today (or keys not date-encoded): fall back to the full
+    # listing ordered by LastModified
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        contents = page.get("Contents")
+        if contents:
+            page_latest = max(contents, key=_object_last_modified)
+            if latest is None or page_latest["LastModified"] > latest["LastModified"]:
+                latest = page_latest
+    return latest["Key"] if latest is not None else None
+
+
+def _copy_sensor_data(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy the cached top level and per-source lists so callers never mutate the cache."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
 
 
 def read_sensor_data() -> dict[str, Any] | None:
@@ -453,35 +518,37 @@ def read_sensor_data() -> dict[str, Any] | None:
     
     if bucket_name:
         try:
-            import boto3
-            from botocore.exceptions import ClientError
-            
-            s3_client = boto3.client("s3")
+            s3_client = _sensor_s3_client()
             prefix = "data/"
+            cache_key = (bucket_name, prefix)
+            cached = _sensor_data_cache.get(cache_key)
+            if cached and time.monotonic() - cached[2] < SENSOR_DATA_CACHE_TTL_SECONDS:
+                return _copy_sensor_data(cached[3])
             
-            response = s3_client.list_objects_v2(
-                Bucket=bucket_name,
-                Prefix=prefix,
-            )
-            
-            if "Contents" in response and len(response["Contents"]) > 0:
-                objects = sorted(
-                    response["Contents"],
-                    key=lambda x: x["LastModified"],
-                    reverse=True,
-                )
-                latest_object = objects[0]
-                object_key = latest_object["Key"]
-                
-                obj_response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-                content = obj_response["Body"].read().decode("utf-8")
-                data = json.loads(content)
+            object_key = _latest_sensor_object_key(s3_client, bucket_name, prefix)
+            if object_key:
+                get_kwargs: dict[str, Any] = {"Bucket": bucket_name, "Key": object_key}
+                if cached and cached[0] == object_key and cached[1]:
+                    get_kwargs["IfNoneMatch"] = cached[1]
+                try:
+                    obj_response = s3_client.get_object(**get_kwargs)
+                except Exception as e:
+                    if "IfNoneMatch" in get_kwargs and _is_not_modified(e):
+                        _sensor_data_cache[cache_key] = (cached[0], cached[1], time.monotonic(), cached[3])
+                        return _copy_sensor_data(cached[3])
+                    raise
+                # Parse the raw body bytes directly; no intermediate decoded str
+                data = orjson.loads(obj_response["Body"].read())
                 
                 # Parse list data into structured format
                 if isinstance(data, list):
-                    return _parse_sensor_data_list(data)
+                    result = _parse_sensor_data_list(data)
                 elif isinstance(data, dict):
-                    return data
+                    result = data
+                else:
+                    return None
+                _sensor_data_cache[cache_key] = (object_key, obj_response.get("ETag", ""), time.monotonic(), result)
+                return _copy_sensor_data(result)
         except Exception:
             pass
     
@@ -489,6 +556,139 @@ def read_sensor_data() -> dict[str, Any] | None:
     return None
 
 
+# AQI categories (matches the frontend enum) and the boundaries that select them:
+# CPCB station AQI uses inclusive upper bounds, forecast thresholds inclusive lower bounds.
+_AQI_CATEGORY_LABELS = ("Good", "Satisfactory", "Moderate", "Poor", "Very Poor", "Severe")
+_CPCB_CATEGORY_UPPER_BOUNDS = (50, 100, 200, 300, 400)
+_FORECAST_CATEGORY_LOWER_BOUNDS = (51, 101, 201, 301, 401)
+
+# Station fields populated from each CPCB pollutant reading (PM2.5 doubles as the AQI proxy)
+_CPCB_POLLUTANT_FIELDS: dict[str, tuple[str, ...]] = {
+    "PM2.5": ("pm25", "aqi"),
+    "PM10": ("pm10",),
+}
+
+# DSS source label -> category. Alternatives are tried in order at position 0, so the
+# first category whose keyword appears anywhere in the label wins (stubble > vehicular > ...).
+_DSS_SOURCE_PATTERN = re.compile(
+    r"(?=.*?(?:stubble|burning))(?P<stubble>)"
+    r"|(?=.*?(?:transport|vehicle|vehicular))(?P<vehicular>)"
+    r"|(?=.*?industr)(?P<industrial>)"
+    r"|(?=.*?dust)(?P<dust>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _build_cpcb_data(cpcb_records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Aggregate CPCB pollutant readings into one entry per station."""
+    stations_dict: dict[str, dict[str, Any]] = {}
+    
+    for record in cpcb_records:
+        station = record.get('station', 'Unknown')
+        pollutant = record.get('pollutant_id', '')
+        pollutant_avg = record.get('pollutant_avg')
+        
+        if station not in stations_dict:
+            stations_dict[station] = {
+                'station': station,
+                'aqi': 0,
+                'pm25': None,
+                'pm10': None,
+                'timestamp': _normalize_timestamp(
+                    record.get('last_update') or record.get('date') or record.get('timestamp')
+                ),
+                'latitude': record.get('latitude'),
+                'longitude': record.get('longitude')
+            }
+        
+        fields = _CPCB_POLLUTANT_FIELDS.get(pollutant)
+        if fields and pollutant_avg is not None:
+            try:
+                value = float(pollutant_avg)
+            except (ValueError, TypeError):
+                continue
+            station_entry = stations_dict[station]
+            for field in fields:
+                station_entry[field] = value
+    
+    # Add category to each station
+    for station_data in stations_dict.values():
+        aqi = station_data.get('aqi', 0)
+        # NaN compares false everywhere, which the old if/elif chain mapped to Severe
+        index = bisect.bisect_left(_CPCB_CATEGORY_UPPER_BOUNDS, aqi) if aqi == aqi else len(_CPCB_CATEGORY_UPPER_BOUNDS)
+        station_data['category'] = _AQI_CATEGORY_LABELS[index]
+        # Ensure lat/lon are floats
+        if station_data.get('latitude'):
+            station_data['lat'] = float(station_data['latitude'])
+        if station_data.get('longitude'):
+            station_data['lon'] = float(station_data['longitude'])
+    
+    return list(stations_dict.values())
+
+
+def _build_nasa_data(nasa_records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the full array of NASA fire hotspots."""
+    nasa_fire_data = []
+    # One fallback timestamp for the whole batch instead of a clock read per undated record
+    fallback_timestamp = datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    for record in nasa_records:
+        try:
+            fire_data = {
+                'lat': float(record.get('latitude', 0)),
+                'lon': float(record.get('longitude', 0)),
+                'brightness': float(record.get('brightness', 0)),
+                'confidence': float(record.get('confidence', 0)),
+                'timestamp': _normalize_timestamp(
+                    record.get('timestamp')
+                    or f"{record.get('acq_date', '')} {record.get('acq_time', '')}".strip()
+                    or record.get('acq_date')
+                )
+                or fallback_timestamp
+            }
+            nasa_fire_data.append(fire_data)
+        except (ValueError, TypeError):
+            continue
+    return nasa_fire_data
+
+
+def _build_dss_data(dss_records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Summarize DSS source-apportionment records."""
+    dss_percentages: dict[str, float] = {}
+    
+    # Newest record wins per category, so walk backwards and stop once
+    # every category has a value instead of scanning the whole list.
+    for record in reversed(dss_records):
+        percentage = record.get('percentage')
+        
+        if percentage is not None:
+            match = _DSS_SOURCE_PATTERN.match(str(record.get('source', '')))
+            if match is None or match.lastgroup in dss_percentages:
+                continue
+            try:
+                dss_percentages[match.lastgroup] = float(percentage)
+            except (ValueError, TypeError):
+                continue
+            if len(dss_percentages) == _DSS_SOURCE_PATTERN.groups:
+                break
+    
+    return {
+        "stubble_burning_percent": dss_percentages.get("stubble") or 0,
+        "affected_area_km2": 0,  # Default if not available
+        "timestamp": _normalize_timestamp(
+            dss_records[0].get('date') or dss_records[0].get('timestamp')
+        ) or datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    }
+
+
+# Record source -> (result field, builder). Records are bucketed in one pass
+# and each non-empty bucket is handed to its builder.
+_SENSOR_SOURCE_HANDLERS: dict[str, tuple[str, Any]] = {
+    "CPCB": ("cpcb_data", _build_cpcb_data),
+    "NASA": ("nasa_data", _build_nasa_data),
+    "DSS": ("dss_data", _build_dss_data),
+}
+
+
 def _parse_sensor_data_list(data: list[dict[str, Any]]) -> dict[str, Any]:
     """Parse sensor data from JSON array into structured format."""
     result: dict[str, Any] = {
@@ -500,136 +700,34 @@ def _parse_sensor_data_list(data: list[dict[str, Any]]) -> dict[str, Any]:
     if not data or not isinstance(data, list):
         return result
     
-    # Extract CPCB records
-    cpcb_records = [r for r in data if str(r.get('data_source', '') or r.get('source', '')).upper() == 'CPCB']
-    
-    if cpcb_records:
-        stations_dict: dict[str, dict[str, Any]] = {}
-        
-        for record in cpcb_records:
-            station = record.get('station', 'Unknown')
-            pollutant = record.get('pollutant_id', '')
-            pollutant_avg = record.get('pollutant_avg')
-            
-            if station not in stations_dict:
-                stations_dict[station] = {
-                    'station': station,
-                    'aqi': 0,
-                    'pm25': None,
-                    'pm10': None,
-                    'timestamp': _normalize_timestamp(
-                        record.get('last_update') or record.get('date') or record.get('timestamp')
-                    ),
-                    'latitude': record.get('latitude'),
-                    'longitude': record.get('longitude')
-                }
-            
-            if pollutant == 'PM2.5' and pollutant_avg is not None:
-                try:
-                    pm25_val = float(pollutant_avg)
-                    stations_dict[station]['pm25'] = pm25_val
-                    stations_dict[station]['aqi'] = pm25_val
-                except (ValueError, TypeError):
-                    pass
-            elif pollutant == 'PM10' and pollutant_avg is not None:
-                try:
-                    pm10_val = float(pollutant_avg)
-                    stations_dict[station]['pm10'] = pm10_val
-                except (ValueError, TypeError):
-                    pass
-        
-        # Add category to each station
-        for station_data in stations_dict.values():
-            aqi = station_data.get('aqi', 0)
-            if aqi <= 50:
-                station_data['category'] = 'Good'
-            elif aqi <= 100:
-                station_data['category'] = 'Satisfactory'
-            elif aqi <= 200:
-                station_data['category'] = 'Moderate'
-            elif aqi <= 300:
-                station_data['category'] = 'Poor'
-            elif aqi <= 400:
-                station_data['category'] = 'Very Poor'
-            else:
-                station_data['category'] = 'Severe'
-            # Ensure lat/lon are floats
-            if station_data.get('latitude'):
-                station_data['lat'] = float(station_data['latitude'])
-            if station_data.get('longitude'):
-                station_data['lon'] = float(station_data['longitude'])
-        
-        result["cpcb_data"] = list(stations_dict.values())
-    
-    # Extract NASA data - return full array of fire hotspots
-    nasa_records = [r for r in data if str(r.get('data_source', '') or r.get('source', '')).upper() == 'NASA']
-    if nasa_records:
-        nasa_fire_data = []
-        for record in nasa_records:
-            try:
-                fire_data = {
-                    'lat': float(record.get('latitude', 0)),
-                    'lon': float(record.get('longitude', 0)),
-                    'brightness': float(record.get('brightness', 0)),
-                    'confidence': float(record.get('confidence', 0)),
-                    'timestamp': _normalize_timestamp(
-                        record.get('timestamp')
-                        or f"{record.get('acq_date', '')} {record.get('acq_time', '')}".strip()
-                        or record.get('acq_date')
-                    )
-                    or datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
-                }
-                nasa_fire_data.append(fire_data)
-            except (ValueError, TypeError):
+    buckets: dict[str, list[dict[str, Any]]] = {source: [] for source in _SENSOR_SOURCE_HANDLERS}
+    for record in data:
+        source = record.get('data_source', '') or record.get('source', '')
+        bucket = buckets.get(source) if isinstance(source, str) else None
+        if bucket is None:
+            # Only normalize labels that are not already upper-case strings
+            bucket = buckets.get(str(source).upper())
+            if bucket is None:
                 continue
-        result["nasa_data"] = nasa_fire_data
+        bucket.append(record)
     
-    # Extract DSS data
-    dss_records = [r for r in data if str(r.get('data_source', '') or r.get('source', '')).upper() == 'DSS']
-    if dss_records:
-        stubble_pct = None
-        vehicular_pct = None
-        industrial_pct = None
-        dust_pct = None
-        
-        for record in dss_records:
-            source_name = str(record.get('source', '')).lower()
-            percentage = record.get('percentage')
-            
-            if percentage is not None:
-                try:
-                    pct_val = float(percentage)
-                    if 'stubble' in source_name or 'burning' in source_name:
-                        stubble_pct = pct_val
-                    elif 'transport' in source_name or 'vehicle' in source_name or 'vehicular' in source_name:
-                        vehicular_pct = pct_val
-                    elif 'industr' in source_name:
-                        industrial_pct = pct_val
-                    elif 'dust' in source_name:
-                        dust_pct = pct_val
-                except (ValueError, TypeError):
-                    pass
-        
-        result["dss_data"] = {
-            "stubble_burning_percent": stubble_pct or 0,
-            "affected_area_km2": 0,  # Default if not available
-            "timestamp": _normalize_timestamp(
-                dss_records[0].get('date') or dss_records[0].get('timestamp')
-            ) or datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
-        }
+    for source, (field, builder) in _SENSOR_SOURCE_HANDLERS.items():
+        if buckets[source]:
+            result[field] = builder(buckets[source])
     
     return result
 
 
 def transform_orchestrator_status(state: dict[str, Any]) -> dict[str, Any]:
     """Transform orchestrator state to match OrchestratorStatus type."""
+    now = datetime.now(tz=timezone.utc)
+    
     # Determine agent statuses
     def get_agent_status(last_timestamp: str | None) -> dict[str, Any]:
         if last_timestamp:
             try:
                 # Check if timestamp is recent (within last hour)
-                ts = datetime.fromisoformat(last_timestamp.replace("Z", "+00:00"))
-                now = datetime.now(tz=timezone.utc)
+                ts = _parse_iso_datetime(last_timestamp)
                 hours_since = (now - ts).total_seconds() / 3600
                 if hours_since < 24:
                     return {
@@ -645,7 +743,7 @@ def transform_orchestrator_status(state: dict[str, Any]) -> dict[str, Any]:
     
     return {
         "status": state.get("status", "unknown"),
-        "last_run": state.get("last_cycle_timestamp") or datetime.now(tz=timezone.utc).isoformat(),
+        "last_run": state.get("last_cycle_timestamp") or now.isoformat(),
         "cycle_duration_seconds": state.get("cycle_duration_seconds", 0),
         "agents": {
             "sensor_ingest": get_agent_status(state.get("last_ingestion_timestamp")),
@@ -663,22 +761,11 @@ def transform_forecast_data(forecast_data: dict[str, Any], forecast_file: Path |
     aqi_category = prediction_data.get("aqi_category", "Moderate")
     if isinstance(aqi_category, str):
         # Ensure it matches TypeScript enum
-        valid_categories = ["Good", "Satisfactory", "Moderate", "Poor", "Very Poor", "Severe"]
-        if aqi_category not in valid_categories:
+        if aqi_category not in _AQI_CATEGORY_LABELS:
             # Try to infer from threshold
             threshold = prediction_data.get("threshold", 0)
-            if threshold >= 401:
-                aqi_category = "Severe"
-            elif threshold >= 301:
-                aqi_category = "Very Poor"
-            elif threshold >= 201:
-                aqi_category = "Poor"
-            elif threshold >= 101:
-                aqi_category = "Moderate"
-            elif threshold >= 51:
-                aqi_category = "Satisfactory"
-            else:
-                aqi_category = "Good"
+            index = bisect.bisect_right(_FORECAST_CATEGORY_LOWER_BOUNDS, threshold) if threshold == threshold else 0
+            aqi_category = _AQI_CATEGORY_LABELS[index]
     
     # Calculate predicted_aqi from current AQI or threshold
     predicted_aqi = data_sources.get("cpcb_aqi", 0)
@@ -741,17 +828,16 @@ def get_forecast_history(days: int = 7) -> list[dict[str, Any]]:
             file_timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
             
             if file_timestamp >= cutoff_date:
-                with open(forecast_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                    data_sources = data.get("data_sources", {})
-                    history.append({
-                        "timestamp": file_timestamp.isoformat(),
-                        "aqi": data_sources.get("cpcb_aqi", 0),
-                        "fire_count": data_sources.get("nasa_fire_count", 0),
-                        "stubble_percent": data_sources.get("stubble_burning_percent", 0)
-                    })
-        except (ValueError, json.JSONDecodeError, Exception):
+                data = orjson.loads(forecast_file.read_bytes())
+                
+                data_sources = data.get("data_sources", {})
+                history.append({
+                    "timestamp": file_timestamp.isoformat(),
+                    "aqi": data_sources.get("cpcb_aqi", 0),
+                    "fire_count": data_sources.get("nasa_fire_count", 0),
+                    "stubble_percent": data_sources.get("stubble_burning_percent", 0)
+                })
+        except (ValueError, orjson.JSONDecodeError, Exception):
             continue
     
     # Sort by timestamp (oldest first)
@@ -786,21 +872,25 @@ def _load_or_run_latest_state(patient_id: str) -> Tuple[str, Dict[str, Any], str
 
 # API Endpoints
 
+# Fixed payload, serialized once at import instead of on every request
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "name": "CarbonFlow API Server",
+    "version": "1.0.0",
+    "endpoints": {
+        "status": "/api/status",
+        "forecast": "/api/forecast/latest",
+        "sensors": "/api/sensors/latest",
+        "logs": "/api/logs/recent",
+        "respiro_sessions": "/api/sessions/create",
+        "respiro_status": "/api/patient/{patient_id}/status"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": "CarbonFlow API Server",
-        "version": "1.0.0",
-        "endpoints": {
-            "status": "/api/status",
-            "forecast": "/api/forecast/latest",
-            "sensors": "/api/sensors/latest",
-            "logs": "/api/logs/recent",
-            "respiro_sessions": "/api/sessions/create",
-            "respiro_status": "/api/patient/{patient_id}/status"
-        }
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/api/status")
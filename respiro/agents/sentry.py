@@ -6,6 +6,7 @@ Monitors and aggregates environmental and physiological data to detect asthma tr
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -41,6 +42,16 @@ class SentryAgent:
         self.settings = get_settings()
         self.s3_client = get_s3_client()
     
+    def _fetch_biometrics(self, patient_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Try HealthKit first, fallback to Fitbit."""
+        biometric_data = None
+        if self.healthkit_client.api_key:
+            biometric_data = self.healthkit_client.get_biometrics(patient_id)
+        
+        if not biometric_data and self.fitbit_client.access_token:
+            biometric_data = self.fitbit_client.get_biometrics()
+        return biometric_data
+    
     def execute(self, state: RespiroState) -> Dict[str, Any]:
         """
         Execute Sentry agent to fuse sensor data and detect triggers.
@@ -61,18 +72,16 @@ class SentryAgent:
             latitude = location.get("latitude", 28.6139)  # Default: Delhi
             longitude = location.get("longitude", 77.2090)
             
-            # Fetch data from all sensors
+            # Fetch data from all sensors; the three upstreams are independent,
+            # so overlap their round-trips instead of paying them back to back
             logger.info("Fetching sensor data...")
-            aqi_data = self.aqi_client.get_aqi(latitude, longitude)
-            pollen_data = self.pollen_client.get_pollen_data(latitude, longitude)
-            
-            # Try HealthKit first, fallback to Fitbit
-            biometric_data = None
-            if self.healthkit_client.api_key:
-                biometric_data = self.healthkit_client.get_biometrics(patient_id)
-            
-            if not biometric_data and self.fitbit_client.access_token:
-                biometric_data = self.fitbit_client.get_biometrics()
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="sentry") as pool:
+                aqi_future = pool.submit(self.aqi_client.get_aqi, latitude, longitude)
+                pollen_future = pool.submit(self.pollen_client.get_pollen_data, latitude, longitude)
+                biometric_future = pool.submit(self._fetch_biometrics, patient_id)
+                aqi_data = aqi_future.result()
+                pollen_data = pollen_future.result()
+                biometric_data = biometric_future.result()
             
             # Fuse sensor data
             fused_data = fuse_sensor_data(aqi_data, pollen_data, biometric_data)
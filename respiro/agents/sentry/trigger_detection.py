@@ -6,7 +6,8 @@ Pattern matching and risk scoring for asthma triggers.
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+import bisect
+from typing import Dict, Any, List, NamedTuple
 from datetime import datetime
 
 from respiro.orchestrator.state import RiskLevel
@@ -15,6 +16,14 @@ from respiro.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+class PollutantLimit(NamedTuple):
+    """Frozen per-pollutant trigger: readings above ``limit`` add ``weight`` to the risk score."""
+    limit: float
+    label: str
+    unit: str
+    weight: float
+
+
 class TriggerDetector:
     """Detects asthma triggers from sensor data."""
     
@@ -27,9 +36,25 @@ class TriggerDetector:
     POLLEN_MODERATE_THRESHOLD = 4
     
     HEART_RATE_ELEVATED_MULTIPLIER = 1.3  # 30% above baseline
+    HEART_RATE_ELEVATED_BPM = 70 * HEART_RATE_ELEVATED_MULTIPLIER  # assuming baseline of 70
     RESPIRATORY_RATE_HIGH = 25  # breaths per minute
     OXYGEN_SATURATION_LOW = 95  # percentage
     
+    # Ascending lower bounds; bisect_right(bounds, value) gives the tier index,
+    # so each chain below is one C-level search instead of sequential compares.
+    AQI_TIER_BOUNDS = (AQI_MODERATE_THRESHOLD, AQI_HIGH_THRESHOLD, AQI_SEVERE_THRESHOLD)
+    AQI_TIERS = (None, ("Moderate", 0.15), ("High", 0.3), ("Severe", 0.4))
+    
+    RISK_LEVEL_BOUNDS = (0.3, 0.5, 0.7)
+    RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH, RiskLevel.SEVERE)
+    
+    # Pollutant code -> limit, looked up once per reading instead of an if/elif on the code
+    POLLUTANT_LIMITS: Dict[str, PollutantLimit] = {
+        "PM2.5": PollutantLimit(55, "PM2.5", "μg/m³", 0.2),
+        "PM10": PollutantLimit(155, "PM10", "μg/m³", 0.15),
+        "O3": PollutantLimit(0.17, "Ozone", "ppm", 0.15),
+    }
+    
     def detect_triggers(self, sensor_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Detect asthma triggers from fused sensor data.
@@ -45,29 +70,22 @@ class TriggerDetector:
         
         # Check air quality
         aqi = sensor_data.get("air_quality", {}).get("aqi", 0)
-        if aqi >= self.AQI_SEVERE_THRESHOLD:
-            risk_factors.append(f"Severe air quality (AQI: {aqi})")
-            risk_score += 0.4
-        elif aqi >= self.AQI_HIGH_THRESHOLD:
-            risk_factors.append(f"High air quality (AQI: {aqi})")
-            risk_score += 0.3
-        elif aqi >= self.AQI_MODERATE_THRESHOLD:
-            risk_factors.append(f"Moderate air quality (AQI: {aqi})")
-            risk_score += 0.15
+        # NaN compares false everywhere, which the old if/elif chain treated as no trigger
+        aqi_tier = self.AQI_TIERS[bisect.bisect_right(self.AQI_TIER_BOUNDS, aqi)] if aqi == aqi else None
+        if aqi_tier is not None:
+            label, weight = aqi_tier
+            risk_factors.append(f"{label} air quality (AQI: {aqi})")
+            risk_score += weight
         
         # Check pollutants
         pollutants = sensor_data.get("air_quality", {}).get("pollutants", {})
+        pollutant_limits = self.POLLUTANT_LIMITS
         for code, data in pollutants.items():
             value = data.get("value", 0)
-            if code == "PM2.5" and value > 55:
-                risk_factors.append(f"High PM2.5 ({value} μg/m³)")
-                risk_score += 0.2
-            elif code == "PM10" and value > 155:
-                risk_factors.append(f"High PM10 ({value} μg/m³)")
-                risk_score += 0.15
-            elif code == "O3" and value > 0.17:
-                risk_factors.append(f"High Ozone ({value} ppm)")
-                risk_score += 0.15
+            limit = pollutant_limits.get(code)
+            if limit is not None and value > limit.limit:
+                risk_factors.append(f"High {limit.label} ({value} {limit.unit})")
+                risk_score += limit.weight
         
         # Check pollen
         pollen_risk = sensor_data.get("pollen", {}).get("overall_risk", "Unknown")
@@ -91,7 +109,7 @@ class TriggerDetector:
         peak_flow = biometrics.get("peak_flow", 0)
         
         # Elevated heart rate (assuming baseline of 70)
-        if heart_rate > 70 * self.HEART_RATE_ELEVATED_MULTIPLIER:
+        if heart_rate > self.HEART_RATE_ELEVATED_BPM:
             risk_factors.append(f"Elevated heart rate ({heart_rate} bpm)")
             risk_score += 0.15
         
@@ -114,14 +132,7 @@ class TriggerDetector:
         risk_score = min(risk_score, 1.0)
         
         # Determine risk level
-        if risk_score >= 0.7:
-            risk_level = RiskLevel.SEVERE
-        elif risk_score >= 0.5:
-            risk_level = RiskLevel.HIGH
-        elif risk_score >= 0.3:
-            risk_level = RiskLevel.MODERATE
-        else:
-            risk_level = RiskLevel.LOW
+        risk_level = self.RISK_LEVELS[bisect.bisect_right(self.RISK_LEVEL_BOUNDS, risk_score)]
         
         return {
             "risk_level": risk_level,
@@ -14,10 +14,10 @@ from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 
-# Load environment variables
+# Load environment variables. load_dotenv stats the path itself and treats a
+# missing file as empty, so no separate exists() check is needed.
 env_path = Path(__file__).parent.parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+load_dotenv(env_path)
 
 
 class AWSSettings(BaseSettings):
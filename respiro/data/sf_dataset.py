@@ -9,6 +9,8 @@ that power the clean-air routing engine.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -40,6 +42,26 @@ def _import_osmnx() -> Any:
     return ox
 
 
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    """
+    Serialize ``payload`` next to ``path`` and atomically swap it into place.
+
+    Readers (e.g. the routing engine polling the PurpleAir snapshot) never see a
+    truncated file if the process dies mid-write.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.stem}_", suffix=".json", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 @dataclass
 class DatasetArtifacts:
     graph_path: Path
@@ -84,13 +106,13 @@ class SFDatasetBuilder:
         pollution_baseline_path = self.cache_dir / POLLUTION_BASELINE_FILENAME
         if force_refresh or not pollution_baseline_path.exists():
             baseline = self.aclima.fetch_airview_geojson(SF_BOUNDING_BOX)
-            pollution_baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+            _write_json_atomic(pollution_baseline_path, baseline)
             logger.info("Cached Aclima baseline containing %s features", len(baseline.get("features", [])))
 
         purpleair_snapshot_path = self.cache_dir / PURPLEAIR_SNAPSHOT_FILENAME
         if force_refresh or not purpleair_snapshot_path.exists():
             sensors = self.purpleair.fetch_sf_sensors()
-            purpleair_snapshot_path.write_text(json.dumps(sensors), encoding="utf-8")
+            _write_json_atomic(purpleair_snapshot_path, sensors)
             logger.info("Cached PurpleAir snapshot with %s sensors", len(sensors))
 
         return DatasetArtifacts(
@@ -105,7 +127,7 @@ class SFDatasetBuilder:
         """
         sensors = self.purpleair.fetch_sf_sensors()
         snapshot_path = self.cache_dir / PURPLEAIR_SNAPSHOT_FILENAME
-        snapshot_path.write_text(json.dumps(sensors), encoding="utf-8")
+        _write_json_atomic(snapshot_path, sensors)
         logger.info("Refreshed PurpleAir snapshot with %s sensors", len(sensors))
         return snapshot_path
 
@@ -6,8 +6,10 @@ LangChain wrapper for Bedrock with error handling, retries, and streaming suppor
 
 from __future__ import annotations
 
+import functools
 from typing import Optional, Iterator, Dict, Any
 import boto3
+from botocore.config import Config
 from langchain_aws import ChatBedrock
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -17,6 +19,14 @@ from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_BOTO_CONFIG = Config(retries={"max_attempts": 3, "mode": "adaptive"}, tcp_keepalive=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _bedrock_runtime_client(region: str) -> Any:
+    """Return a process-wide bedrock-runtime client; agents build BedrockClient per instance."""
+    return boto3.client('bedrock-runtime', region_name=region, config=_BOTO_CONFIG)
+
 
 class BedrockClient:
     """Client for Amazon Bedrock LLM."""
@@ -27,13 +37,11 @@ class BedrockClient:
         self.model_id = settings.bedrock.model_id
         
         # Initialize Bedrock client
-        self.bedrock_runtime = boto3.client(
-            'bedrock-runtime',
-            region_name=self.region
-        )
+        self.bedrock_runtime = _bedrock_runtime_client(self.region)
         
-        # Initialize LangChain ChatBedrock
+        # Initialize LangChain ChatBedrock on the shared runtime client
         self.llm = ChatBedrock(
+            client=self.bedrock_runtime,
             model_id=self.model_id,
             region_name=self.region,
             model_kwargs={
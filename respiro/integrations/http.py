@@ -0,0 +1,41 @@
+"""
+Shared HTTP session for outbound integration calls.
+
+Reusing one session keeps TCP/TLS connections alive across calls to the same
+upstream (Open-Meteo, PurpleAir, Google APIs, ...) instead of paying a fresh
+handshake per request.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _build_session() -> requests.Session:
+    # No urllib3-level retries: callers already retry with tenacity, and a second
+    # layer here would multiply attempts and stack backoffs past their timeouts.
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Global HTTP session instance
+_http_session: Optional[requests.Session] = None
+# First use can come from several worker threads at once (sentry, meteorology)
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get or create the global pooled HTTP session."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = _build_session()
+    return _http_session
@@ -1,8 +1,9 @@
 """Insurance integration for premium adjustments and wellness programs."""
 from typing import Dict, Any, Optional
-import requests
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +13,9 @@ class InsuranceClient:
         settings = get_settings()
         self.base_url = settings.api.insurance_api_base_url
         self.api_key = settings.api.insurance_api_key
+        # Built once per client instead of on every request
+        self._headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        self._premium_url = f"{self.base_url}/premium/adjustment"
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     def request_premium_adjustment(self, patient_id: str, adherence_score: float) -> bool:
@@ -19,10 +23,10 @@ class InsuranceClient:
         if not self.base_url or not self.api_key:
             return False
         try:
-            response = requests.post(
-                f"{self.base_url}/premium/adjustment",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={"patient_id": patient_id, "adherence_score": adherence_score},
+            response = get_http_session().post(
+                self._premium_url,
+                headers=self._headers,
+                data=orjson.dumps({"patient_id": patient_id, "adherence_score": adherence_score}),
                 timeout=10
             )
             response.raise_for_status()
@@ -1,20 +1,31 @@
 """AWS IoT Core integration."""
+import functools
 from typing import Dict, Any, Optional
-import json
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from respiro.config.settings import get_settings
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_BOTO_CONFIG = Config(retries={"max_attempts": 3, "mode": "adaptive"}, tcp_keepalive=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _boto_client(service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None) -> Any:
+    """Return a process-wide boto3 client so endpoint resolution and connection pools are reused."""
+    return boto3.client(service_name, region_name=region_name, endpoint_url=endpoint_url, config=_BOTO_CONFIG)
+
+
 class IoTClient:
     def __init__(self):
         settings = get_settings()
         self.endpoint = settings.iot.endpoint
         self.thing_name = settings.iot.thing_name
-        self.iot_data_client = boto3.client('iot-data', endpoint_url=f"https://{self.endpoint}")
-        self.iot_client = boto3.client('iot', region_name=settings.aws.region)
+        self.iot_data_client = _boto_client('iot-data', endpoint_url=f"https://{self.endpoint}")
+        self.iot_client = _boto_client('iot', region_name=settings.aws.region)
     
     def publish_command(self, device_id: str, command: Dict[str, Any]) -> bool:
         """Publish command to IoT device."""
@@ -23,7 +34,7 @@ class IoTClient:
             response = self.iot_data_client.publish(
                 topic=topic,
                 qos=1,
-                payload=json.dumps(command)
+                payload=orjson.dumps(command)
             )
             logger.info(f"Published command to {topic}")
             return True
@@ -40,7 +51,7 @@ class IoTClient:
             response = self.iot_data_client.get_thing_shadow(
                 thingName=device_id
             )
-            payload = json.loads(response['payload'].read())
+            payload = orjson.loads(response['payload'].read())
             return payload.get('state', {})
         except ClientError as e:
             logger.error(f"Failed to get device shadow: {e}")
@@ -4,18 +4,57 @@ Meteorology and pollen data integrations.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
 import requests
 
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Open-Meteo refreshes hourly and Google Pollen daily, so successful responses
+# are reused for this long per ~1 km grid cell instead of re-hitting the network.
+RESPONSE_CACHE_TTL_SECONDS = 1800
+# Upper bound on cached grid cells; the oldest entries are dropped beyond this.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_response_cache: Dict[Tuple[str, float, float], Tuple[float, Any]] = {}
+_response_cache_lock = threading.Lock()
 
-@dataclass
+
+def _cache_key(kind: str, lat: float, lon: float) -> Tuple[str, float, float]:
+    return kind, round(lat, 2), round(lon, 2)
+
+
+def _cache_get(key: Tuple[str, float, float]) -> Any:
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > RESPONSE_CACHE_TTL_SECONDS:
+        return None
+    return entry[1]
+
+
+def _cache_put(key: Tuple[str, float, float], value: Any) -> None:
+    now = time.monotonic()
+    with _response_cache_lock:
+        # Re-insert so dict order stays oldest-first, then prune from the front:
+        # expired entries first, then the oldest ones while over the size bound.
+        _response_cache.pop(key, None)
+        _response_cache[key] = (now, value)
+        while _response_cache:
+            oldest_key, (stored_at, _) = next(iter(_response_cache.items()))
+            if now - stored_at <= RESPONSE_CACHE_TTL_SECONDS and len(_response_cache) <= RESPONSE_CACHE_MAX_ENTRIES:
+                break
+            del _response_cache[oldest_key]
+
+
+@dataclass(frozen=True)
 class WindContext:
     direction_deg: float
     speed_kmh: float
@@ -29,15 +68,21 @@ class MeteorologyClient:
         self.google_pollen_key = settings.api.google_pollen_api_key
 
     def fetch_wind(self, lat: float, lon: float) -> Optional[WindContext]:
+        cache_key = _cache_key("wind", lat, lon)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
         params = {
             "latitude": lat,
             "longitude": lon,
             "hourly": "relativehumidity_2m",
+            # Only the first hourly sample is read; skip the default 7-day series.
+            "forecast_days": 1,
             "windspeed_unit": "kmh",
             "current_weather": True,
         }
         try:
-            response = requests.get(self.open_meteo_base_url, params=params, timeout=10)
+            response = get_http_session().get(self.open_meteo_base_url, params=params, timeout=10)
             response.raise_for_status()
         except requests.RequestException as exc:
             logger.error("OpenMeteo request failed: %s", exc)
@@ -48,29 +93,44 @@ class MeteorologyClient:
             return None
         humidity_series = data.get("hourly", {}).get("relativehumidity_2m", [])
         humidity = humidity_series[0] if humidity_series else None
-        return WindContext(
+        wind = WindContext(
             direction_deg=float(current.get("winddirection") or 0.0),
             speed_kmh=float(current.get("windspeed") or 0.0),
             humidity=float(humidity) if humidity is not None else None,
         )
+        _cache_put(cache_key, wind)
+        return wind
 
     def fetch_pollen(self, lat: float, lon: float) -> Dict[str, Any]:
         if not self.google_pollen_key:
             logger.warning("Google Pollen API key missing")
             return {}
+        cache_key = _cache_key("pollen", lat, lon)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            # Cached as the raw response body so every caller decodes its own dict;
+            # callers put it into agent context that is mutated downstream.
+            return orjson.loads(cached)
         params = {"location": f"{lat},{lon}", "key": self.google_pollen_key}
         url = "https://pollen.googleapis.com/v1/forecast:lookup"
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            pollen = response.json()
         except requests.RequestException as exc:
             logger.error("Google Pollen request failed: %s", exc)
             return {}
+        if pollen:
+            _cache_put(cache_key, response.content)
+        return pollen
 
     def summarize_context(self, lat: float, lon: float) -> Dict[str, Any]:
-        wind = self.fetch_wind(lat, lon)
-        pollen = self.fetch_pollen(lat, lon)
+        # Open-Meteo and Google Pollen are independent; overlap their round-trips
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="meteorology") as pool:
+            wind_future = pool.submit(self.fetch_wind, lat, lon)
+            pollen_future = pool.submit(self.fetch_pollen, lat, lon)
+            wind = wind_future.result()
+            pollen = pollen_future.result()
         alerts = []
         if pollen:
             day = pollen.get("dailyInfo", [{}])[0]
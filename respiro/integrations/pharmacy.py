@@ -1,8 +1,9 @@
 """Pharmacy integration for discount codes and medication management."""
 from typing import Dict, Any, List, Optional
-import requests
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +13,9 @@ class PharmacyClient:
         settings = get_settings()
         self.base_url = settings.api.pharmacy_api_base_url
         self.api_key = settings.api.pharmacy_api_key
+        # Built once per client instead of on every request
+        self._headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+        self._discounts_url = f"{self.base_url}/discounts/generate"
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     def generate_discount_code(self, patient_id: str, medication: str) -> Optional[str]:
@@ -19,14 +23,14 @@ class PharmacyClient:
         if not self.base_url or not self.api_key:
             return None
         try:
-            response = requests.post(
-                f"{self.base_url}/discounts/generate",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={"patient_id": patient_id, "medication": medication},
+            response = get_http_session().post(
+                self._discounts_url,
+                headers=self._headers,
+                data=orjson.dumps({"patient_id": patient_id, "medication": medication}),
                 timeout=10
             )
             response.raise_for_status()
-            return response.json().get("discount_code")
+            return orjson.loads(response.content).get("discount_code")
         except Exception as e:
             logger.error(f"Pharmacy API failed: {e}")
             return None
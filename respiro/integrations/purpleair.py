@@ -7,9 +7,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import requests
 
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,12 +19,18 @@ logger = get_logger(__name__)
 
 SF_BOUNDING_BOX = (37.70, -122.52, 37.81, -122.35)  # (south, west, north, east)
 
+# EPA correction: corrected = PM25 * pm25 - HUMIDITY * humidity + INTERCEPT.
+# Shared by the scalar helper and the column-wise path in fetch_bbox.
+EPA_CORRECTION_PM25_COEF = 0.52
+EPA_CORRECTION_HUMIDITY_COEF = 0.086
+EPA_CORRECTION_INTERCEPT = 5.75
+
 
 def apply_epa_correction(pm25: float, humidity: float) -> float:
     """
     Apply the EPA correction that mitigates fog-induced false positives.
     """
-    corrected = 0.52 * pm25 - 0.086 * humidity + 5.75
+    corrected = EPA_CORRECTION_PM25_COEF * pm25 - EPA_CORRECTION_HUMIDITY_COEF * humidity + EPA_CORRECTION_INTERCEPT
     return max(corrected, 0.0)
 
 
@@ -78,7 +86,7 @@ class PurpleAirClient:
         headers = {"X-API-Key": self.api_key}
 
         try:
-            response = requests.get(self.BASE_URL, params=params, headers=headers, timeout=15)
+            response = get_http_session().get(self.BASE_URL, params=params, headers=headers, timeout=15)
             response.raise_for_status()
         except requests.RequestException as exc:
             logger.error("PurpleAir request failed: %s", exc)
@@ -87,12 +95,27 @@ class PurpleAirClient:
         payload = response.json()
         fields_header = payload.get("fields", [])
         data_rows = payload.get("data", [])
-        sanitized: List[Dict[str, Any]] = []
-        for row in data_rows:
-            row_dict = dict(zip(fields_header, row))
-            pm25_raw = float(row_dict.get("pm2.5_alt") or row_dict.get("pm2.5_cf_1") or 0.0)
-            humidity = float(row_dict.get("humidity") or 0.0)
-            row_dict["pm25_corrected"] = apply_epa_correction(pm25_raw, humidity)
-            sanitized.append(row_dict)
+        sanitized: List[Dict[str, Any]] = [dict(zip(fields_header, row)) for row in data_rows]
+        if not sanitized:
+            return sanitized
+        # Correct the whole PM2.5/humidity columns at once instead of per row
+        pm25_raw = np.fromiter(
+            (float(row.get("pm2.5_alt") or row.get("pm2.5_cf_1") or 0.0) for row in sanitized),
+            dtype=np.float64,
+            count=len(sanitized),
+        )
+        humidity = np.fromiter(
+            (float(row.get("humidity") or 0.0) for row in sanitized),
+            dtype=np.float64,
+            count=len(sanitized),
+        )
+        corrected = np.maximum(
+            EPA_CORRECTION_PM25_COEF * pm25_raw
+            - EPA_CORRECTION_HUMIDITY_COEF * humidity
+            + EPA_CORRECTION_INTERCEPT,
+            0.0,
+        ).tolist()
+        for row_dict, pm25_corrected in zip(sanitized, corrected):
+            row_dict["pm25_corrected"] = pm25_corrected
         return sanitized
 
@@ -15,6 +15,7 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -62,7 +63,7 @@ class GoogleAQIClient:
                 "location.longitude": longitude
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -140,7 +141,7 @@ class AmbeeClient:
                 "lng": longitude
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = get_http_session().get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -210,7 +211,7 @@ class HealthKitClient:
                 "hours": hours
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = get_http_session().get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -255,7 +256,7 @@ class FitbitClient:
                 "refresh_token": self.refresh_token
             }
             
-            response = requests.post(url, auth=auth, data=data, timeout=10)
+            response = get_http_session().post(url, auth=auth, data=data, timeout=10)
             response.raise_for_status()
             
             token_data = response.json()
@@ -303,13 +304,13 @@ class FitbitClient:
                 "Authorization": f"Bearer {self.access_token}"
             }
             
-            hr_response = requests.get(hr_url, headers=headers, timeout=10)
+            hr_response = get_http_session().get(hr_url, headers=headers, timeout=10)
             
             # Handle token expiration
             if hr_response.status_code == 401:
                 if self._refresh_access_token():
                     headers["Authorization"] = f"Bearer {self.access_token}"
-                    hr_response = requests.get(hr_url, headers=headers, timeout=10)
+                    hr_response = get_http_session().get(hr_url, headers=headers, timeout=10)
                 else:
                     return None
             
@@ -318,12 +319,12 @@ class FitbitClient:
             
             # Get SpO2 data
             spo2_url = f"https://api.fitbit.com/1/user/{user_id}/spo2/date/{date}.json"
-            spo2_response = requests.get(spo2_url, headers=headers, timeout=10)
+            spo2_response = get_http_session().get(spo2_url, headers=headers, timeout=10)
             
             if spo2_response.status_code == 401:
                 if self._refresh_access_token():
                     headers["Authorization"] = f"Bearer {self.access_token}"
-                    spo2_response = requests.get(spo2_url, headers=headers, timeout=10)
+                    spo2_response = get_http_session().get(spo2_url, headers=headers, timeout=10)
             
             spo2_data = spo2_response.json() if spo2_response.status_code == 200 else {}
             
@@ -512,6 +512,8 @@ def build_graph() -> StateGraph:
             "rewards": "rewards",
             "end": END
         }
+    )
+    
     graph.add_conditional_edges(
         "meteorologist",
         check_approval,
@@ -538,8 +540,6 @@ def build_graph() -> StateGraph:
             "continue": "route_to_agent"
         }
     )
-
-    )
     
     # After each agent, check for approval requirement
     graph.add_conditional_edges(
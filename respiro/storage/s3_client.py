@@ -6,12 +6,15 @@ Handles all S3 operations for patient data, FHIR documents, memory backups, and
 
 from __future__ import annotations
 
-import json
+import gzip
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Dict, List
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -20,6 +23,25 @@ from respiro.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Client-side rate adaptation on throttling, and TCP keep-alive so the pooled
+# connections survive the idle gaps between agent ticks.
+_BOTO_CONFIG = Config(
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    max_pool_connections=20,
+)
+
+# Parallel GETs when scanning a patient's sessions (stays within the pool size above)
+SESSION_FETCH_WORKERS = 16
+
+# Datetimes and dataclasses go through ``default=str`` as they did with stdlib json
+_JSON_DUMP_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_SERIALIZE_NUMPY
+)
+
 
 class S3Client:
     """Centralized S3 client for Respiro."""
@@ -34,7 +56,8 @@ class S3Client:
             's3',
             region_name=self.region,
             aws_access_key_id=settings.aws.access_key_id,
-            aws_secret_access_key=settings.aws.secret_access_key
+            aws_secret_access_key=settings.aws.secret_access_key,
+            config=_BOTO_CONFIG,
         )
     
     @retry(
@@ -60,7 +83,7 @@ class S3Client:
             True if successful
         """
         try:
-            body = json.dumps(data, default=str, ensure_ascii=False)
+            body = orjson.dumps(data, default=str, option=_JSON_DUMP_OPTIONS)
             extra_args = {}
             if metadata:
                 extra_args['Metadata'] = metadata
@@ -68,14 +91,55 @@ class S3Client:
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=body.encode('utf-8'),
+                Body=body,
                 ContentType='application/json',
                 **extra_args
             )
-            logger.info(f"Uploaded JSON to s3://{self.bucket_name}/{key}")
+            logger.debug("Uploaded JSON to s3://%s/%s", self.bucket_name, key)
             return True
         except Exception as e:
-            logger.error(f"Failed to upload JSON to {key}: {e}")
+            logger.error("Failed to upload JSON to %s: %s", key, e)
+            raise
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((ClientError, BotoCoreError))
+    )
+    def upload_ndjson_gzip(
+        self,
+        key: str,
+        lines: bytes,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Upload pre-serialized newline-delimited JSON as a single gzip object.
+        
+        Args:
+            key: S3 object key
+            lines: NDJSON payload, one record per line
+            metadata: Optional metadata
+            
+        Returns:
+            True if successful
+        """
+        try:
+            extra_args = {}
+            if metadata:
+                extra_args['Metadata'] = metadata
+            
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=gzip.compress(lines, compresslevel=3),
+                ContentType='application/x-ndjson',
+                ContentEncoding='gzip',
+                **extra_args
+            )
+            logger.debug("Uploaded NDJSON batch to s3://%s/%s", self.bucket_name, key)
+            return True
+        except Exception as e:
+            logger.error("Failed to upload NDJSON batch to %s: %s", key, e)
             raise
     
     @retry(
@@ -95,16 +159,15 @@ class S3Client:
         """
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            return json.loads(content)
+            return orjson.loads(response['Body'].read())
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
-                logger.warning(f"Key not found in S3: {key}")
+                logger.warning("Key not found in S3: %s", key)
                 return None
-            logger.error(f"Failed to download JSON from {key}: {e}")
+            logger.error("Failed to download JSON from %s: %s", key, e)
             raise
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from {key}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON from %s: %s", key, e)
             raise
     
     def save_patient_data(self, patient_id: str, data: Dict[str, Any]) -> bool:
@@ -182,7 +245,7 @@ class S3Client:
                         legacy_sessions.append(key.split("/")[-2])
             return legacy_sessions
         except Exception as e:
-            logger.error(f"Failed to list sessions for patient {patient_id}: {e}")
+            logger.error("Failed to list sessions for patient %s: %s", patient_id, e)
             return []
     
     def load_latest_session(self, patient_id: str) -> Optional[Dict[str, Any]]:
@@ -200,16 +263,23 @@ class S3Client:
             if not sessions:
                 return None
             
-            # Load all sessions and find the latest
-            latest_session = None
-            latest_timestamp = None
-            
-            for session_id in sessions:
+            # Load all sessions concurrently (botocore releases the GIL on network I/O)
+            # and find the latest; map() keeps session order so ties resolve as before.
+            def _load_session_log(session_id: str) -> Optional[Dict[str, Any]]:
                 log_data = self.download_json(f"sessions/{patient_id}/{session_id}/log.json")
                 if not log_data:
                     # Fallback for legacy layout without patient prefix
                     legacy_key = f"sessions/{session_id}/log.json"
                     log_data = self.download_json(legacy_key)
+                return log_data
+            
+            with ThreadPoolExecutor(max_workers=min(SESSION_FETCH_WORKERS, len(sessions))) as pool:
+                session_logs = list(pool.map(_load_session_log, sessions))
+            
+            latest_session = None
+            latest_timestamp = None
+            
+            for log_data in session_logs:
                 if log_data:
                     updated_at = log_data.get("updated_at") or log_data.get("created_at")
                     if updated_at:
@@ -224,7 +294,7 @@ class S3Client:
             
             return latest_session
         except Exception as e:
-            logger.error(f"Failed to load latest session for patient {patient_id}: {e}")
+            logger.error("Failed to load latest session for patient %s: %s", patient_id, e)
             return None
 
 
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from copy import deepcopy
 from datetime import datetime
-from types import SimpleNamespace
+from importlib import util
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
 from typing import Any, Callable, Dict, List, Optional
 import logging
 import sys
@@ -120,6 +122,22 @@ def _install_stub_modules():
 _install_stub_modules()
 
 
+AGENTS_DIR = Path(__file__).resolve().parents[2] / "agents"
+_AGENT_MODULES: Dict[str, ModuleType] = {}
+
+
+def load_agent_module(stem: str) -> ModuleType:
+    """Load ``respiro/agents/<stem>.py`` by path once per test session."""
+    module = _AGENT_MODULES.get(stem)
+    if module is None:
+        spec = util.spec_from_file_location(f"respiro.agents.{stem}_module", AGENTS_DIR / f"{stem}.py")
+        module = util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(module)
+        _AGENT_MODULES[stem] = module
+    return module
+
+
 class FakeS3Client:
     """In-memory S3 stub that records uploads."""
 
@@ -178,9 +196,12 @@ def patient_id() -> str:
     return "patient-test-123"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_state(patient_id: str) -> RespiroState:
-    """Baseline orchestrator state seeded with deterministic context."""
+    """Baseline orchestrator state seeded with deterministic context.
+
+    Built once per module; tests receive isolated copies via ``state_factory``.
+    """
     state = create_initial_state(
         patient_id=patient_id,
         session_id="session-test",
@@ -1,23 +1,12 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List
-from importlib import util
-from pathlib import Path
 
 import pytest
 
-AGENTS_DIR = Path(__file__).resolve().parents[2] / "agents"
+from respiro.tests.agents.conftest import load_agent_module
 
-
-def _load_agent_module(stem: str):
-    spec = util.spec_from_file_location(f"respiro.agents.{stem}_module", AGENTS_DIR / f"{stem}.py")
-    module = util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
-
-
-clinical_module = _load_agent_module("clinical")
+clinical_module = load_agent_module("clinical")
 ClinicalAgent = clinical_module.ClinicalAgent
 
 
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+import orjson
+
+from respiro.integrations import meteorology
+
+
+def test_response_cache_is_bounded_and_prunes_expired(monkeypatch):
+    monkeypatch.setattr(meteorology, "_response_cache", {})
+    monkeypatch.setattr(meteorology, "RESPONSE_CACHE_MAX_ENTRIES", 3)
+    clock = iter(range(0, 1000, 10))
+    monkeypatch.setattr(meteorology, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+
+    for lat in range(5):
+        meteorology._cache_put(("wind", float(lat), 0.0), lat)
+    assert list(meteorology._response_cache) == [("wind", float(lat), 0.0) for lat in (2, 3, 4)]
+
+    monkeypatch.setattr(meteorology, "RESPONSE_CACHE_TTL_SECONDS", 5)
+    meteorology._cache_put(("pollen", 0.0, 0.0), {"ok": True})
+    assert list(meteorology._response_cache) == [("pollen", 0.0, 0.0)]
+
+
+def test_cached_pollen_is_not_shared_between_callers(monkeypatch):
+    monkeypatch.setattr(meteorology, "_response_cache", {})
+    body = b'{"dailyInfo": [{"pollenTypeInfo": []}]}'
+    response = SimpleNamespace(content=body, raise_for_status=lambda: None, json=lambda: orjson.loads(body))
+    session = SimpleNamespace(get=lambda *args, **kwargs: response)
+    monkeypatch.setattr(meteorology, "get_http_session", lambda: session)
+    client = meteorology.MeteorologyClient.__new__(meteorology.MeteorologyClient)
+    client.google_pollen_key = "key"
+
+    first = client.fetch_pollen(37.77, -122.42)
+    first["dailyInfo"].append({"mutated": True})
+    second = client.fetch_pollen(37.77, -122.42)
+    third = client.fetch_pollen(37.77, -122.42)
+
+    assert second == {"dailyInfo": [{"pollenTypeInfo": []}]}
+    assert second is not third
@@ -0,0 +1,77 @@
+import gzip
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from respiro.storage.s3_client import S3Client
+
+
+class _Gzipped:
+    """Matches a request body that decompresses to ``expected``."""
+
+    def __init__(self, expected: bytes):
+        self.expected = expected
+
+    def __eq__(self, other):
+        return gzip.decompress(other) == self.expected
+
+    def __ne__(self, other):
+        return not self == other
+
+
+@pytest.fixture(scope="module")
+def boto_s3_client():
+    """boto3 S3 client built once per module; each test wraps it in a fresh Stubber."""
+    return boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+
+
+@pytest.fixture
+def stubbed_client(boto_s3_client):
+    client = S3Client.__new__(S3Client)
+    client.bucket_name = "respiro-test-bucket"
+    client.region = "us-east-1"
+    client.s3_client = boto_s3_client
+    with Stubber(client.s3_client) as stubber:
+        yield client, stubber
+        stubber.assert_no_pending_responses()
+
+
+def test_upload_json_puts_utf8_body(stubbed_client):
+    client, stubber = stubbed_client
+    stubber.add_response(
+        "put_object",
+        {"ETag": '"etag"'},
+        expected_params={
+            "Bucket": "respiro-test-bucket",
+            "Key": "patients/p1/data.json",
+            "Body": '{"name":"Zoë"}'.encode("utf-8"),
+            "ContentType": "application/json",
+            "Metadata": {"patient_id": "p1"},
+        },
+    )
+
+    assert client.save_patient_data("p1", {"name": "Zoë"}) is True
+
+
+def test_upload_ndjson_gzip_sets_encoding(stubbed_client):
+    client, stubber = stubbed_client
+    lines = b'{"a": 1}\n{"a": 2}\n'
+    stubber.add_response(
+        "put_object",
+        {"ETag": '"etag"'},
+        expected_params={
+            "Bucket": "respiro-test-bucket",
+            "Key": "logs/application/batch.ndjson.gz",
+            "Body": _Gzipped(lines),
+            "ContentType": "application/x-ndjson",
+            "ContentEncoding": "gzip",
+        },
+    )
+
+    assert client.upload_ndjson_gzip("logs/application/batch.ndjson.gz", lines) is True
@@ -0,0 +1,24 @@
+import numpy as np
+
+from respiro.tools.sf_routing_engine import idw, idw_many
+
+
+def test_idw_many_matches_idw_with_tied_sensors():
+    # Sensors 0-2 are co-located and tie for the 3rd-nearest slot behind sensors
+    # 3 and 4; idw()'s stable sort keeps sensor 0, and idw_many must agree.
+    tied, near, far = (37.7720, -122.4200), (37.7710, -122.4200), (37.7730, -122.4200)
+    samples = [
+        (*tied, 10.0),
+        (*tied, 20.0),
+        (*tied, 30.0),
+        (*near, 40.0),
+        (*near, 50.0),
+        (*far, 60.0),
+    ]
+    lats = np.array([37.7700])
+    lons = np.array([-122.4200])
+    sample_lats, sample_lons, sample_values = (np.array(column) for column in zip(*samples))
+
+    expected = [idw(lat, lon, samples) for lat, lon in zip(lats, lons)]
+    result = idw_many(lats, lons, sample_lats, sample_lons, sample_values)
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
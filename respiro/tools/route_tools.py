@@ -7,10 +7,10 @@ Calculate cleaner commute routes based on AQI.
 from __future__ import annotations
 
 from typing import Dict, Any, List, Optional, Tuple
-import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from respiro.config.settings import get_settings
+from respiro.integrations.http import get_http_session
 from respiro.utils.logging import get_logger
 from respiro.tools.sf_routing_engine import SFRoutingEngine
 
@@ -89,7 +89,7 @@ class RouteOptimizer:
                 "alternatives": "true"
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
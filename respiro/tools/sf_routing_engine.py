@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 
 from respiro.data import SFDatasetBuilder
 from respiro.utils.logging import get_logger
@@ -24,9 +25,11 @@ def _import_osmnx():
     return ox
 
 
-def pm25_to_aqi(pm25: float) -> float:
-    """Approximate US AQI from PM2.5 concentration."""
-    breakpoints = [
+# US EPA PM2.5 breakpoints: (c_low, c_high, aqi_low, slope). The slope
+# (aqi_high - aqi_low) / (c_high - c_low) is folded once here instead of per call.
+_PM25_AQI_BREAKPOINTS = tuple(
+    (c_low, c_high, aqi_low, (aqi_high - aqi_low) / (c_high - c_low))
+    for c_low, c_high, aqi_low, aqi_high in (
         (0.0, 12.0, 0, 50),
         (12.1, 35.4, 51, 100),
         (35.5, 55.4, 101, 150),
@@ -34,13 +37,33 @@ def pm25_to_aqi(pm25: float) -> float:
         (150.5, 250.4, 201, 300),
         (250.5, 350.4, 301, 400),
         (350.5, 500.4, 401, 500),
-    ]
-    for c_low, c_high, aqi_low, aqi_high in breakpoints:
+    )
+)
+
+
+def pm25_to_aqi(pm25: float) -> float:
+    """Approximate US AQI from PM2.5 concentration."""
+    for c_low, c_high, aqi_low, slope in _PM25_AQI_BREAKPOINTS:
         if c_low <= pm25 <= c_high:
-            return ((aqi_high - aqi_low) / (c_high - c_low)) * (pm25 - c_low) + aqi_low
+            return slope * (pm25 - c_low) + aqi_low
     return 500.0
 
 
+_PM25_C_LOWS = np.array([bp[0] for bp in _PM25_AQI_BREAKPOINTS])
+_PM25_C_HIGHS = np.array([bp[1] for bp in _PM25_AQI_BREAKPOINTS])
+_PM25_AQI_LOWS = np.array([bp[2] for bp in _PM25_AQI_BREAKPOINTS], dtype=np.float64)
+_PM25_SLOPES = np.array([bp[3] for bp in _PM25_AQI_BREAKPOINTS])
+
+
+def pm25_to_aqi_many(pm25: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`pm25_to_aqi`; values outside every breakpoint map to 500."""
+    segment = np.searchsorted(_PM25_C_LOWS, pm25, side="right") - 1
+    clipped = np.clip(segment, 0, None)
+    in_range = (segment >= 0) & (pm25 <= _PM25_C_HIGHS[clipped])
+    aqi = _PM25_SLOPES[clipped] * (pm25 - _PM25_C_LOWS[clipped]) + _PM25_AQI_LOWS[clipped]
+    return np.where(in_range, aqi, 500.0)
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Distance in meters."""
     r = 6371000  # Earth radius
@@ -76,6 +99,49 @@ def idw(
     return weighted / total_weight if total_weight else 0.0
 
 
+def _haversine_matrix(lats: np.ndarray, lons: np.ndarray, sample_lats: np.ndarray, sample_lons: np.ndarray) -> np.ndarray:
+    """Pairwise haversine distances in meters, shape ``(len(lats), len(sample_lats))``."""
+    phi1 = np.radians(lats)[:, None]
+    phi2 = np.radians(sample_lats)[None, :]
+    d_phi = np.radians(sample_lats[None, :] - lats[:, None])
+    d_lambda = np.radians(sample_lons[None, :] - lons[:, None])
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 6371000 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def idw_many(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    sample_lats: np.ndarray,
+    sample_lons: np.ndarray,
+    sample_values: np.ndarray,
+    k: int = 3,
+    power: float = 2.0,
+    block_size: int = 4096,
+) -> np.ndarray:
+    """Vectorized :func:`idw` over many query points with column-wise samples."""
+    result = np.zeros(len(lats), dtype=np.float64)
+    if len(sample_values) == 0:
+        return result
+    k = min(k, len(sample_values))
+    for start in range(0, len(lats), block_size):
+        stop = start + block_size
+        dist = _haversine_matrix(lats[start:stop], lons[start:stop], sample_lats, sample_lons)
+        # Stable sort so sensors tied on distance keep sample order, as sorted() does in idw()
+        nearest = np.argsort(dist, axis=1, kind="stable")[:, :k]
+        nearest_dist = np.take_along_axis(dist, nearest, axis=1)
+        values = sample_values[nearest]
+        exact = nearest_dist[:, 0] == 0
+        with np.errstate(divide="ignore"):
+            weights = 1 / nearest_dist**power
+        weights[exact] = 0.0
+        total = weights.sum(axis=1)
+        block = np.divide((weights * values).sum(axis=1), total, out=np.zeros_like(total), where=total > 0)
+        block[exact] = values[exact, 0]
+        result[start:stop] = block
+    return result
+
+
 @dataclass
 class RouteResult:
     path: List[int]
@@ -98,6 +164,9 @@ SF_PARKS = [
 
 PARK_RADIUS_METERS = 500  # 500m radius around parks for pollen penalty
 
+_PARK_LATS = np.array([park[0] for park in SF_PARKS], dtype=np.float64)
+_PARK_LONS = np.array([park[1] for park in SF_PARKS], dtype=np.float64)
+
 
 class SFRoutingEngine:
     """Compute respiratory-aware routes for San Francisco."""
@@ -116,7 +185,10 @@ class SFRoutingEngine:
 
     def _prepare_graph(self) -> None:
         sensors = self.dataset.latest_purpleair_snapshot()
-        sensor_points = []
+        # Sensor readings as parallel columns rather than one tuple per sensor
+        sensor_lats: List[float] = []
+        sensor_lons: List[float] = []
+        sensor_pm25: List[float] = []
         for sensor in sensors:
             try:
                 lat = float(sensor.get("latitude"))
@@ -124,14 +196,37 @@ class SFRoutingEngine:
                 pm25 = float(sensor.get("pm25_corrected") or sensor.get("pm2.5_alt") or 0.0)
             except (TypeError, ValueError):
                 continue
-            sensor_points.append((lat, lon, pm25))
-        logger.info("Assigning pollution factors using %s PurpleAir sensors", len(sensor_points))
-        for node_id, data in self.graph.nodes(data=True):
-            lat = float(data.get("y"))
-            lon = float(data.get("x"))
-            pm25 = idw(lat, lon, sensor_points) if sensor_points else 12.0
-            aqi = pm25_to_aqi(pm25)
-            pollution_factor = min(aqi / 300.0, 1.5)
+            sensor_lats.append(lat)
+            sensor_lons.append(lon)
+            sensor_pm25.append(pm25)
+        logger.info("Assigning pollution factors using %s PurpleAir sensors", len(sensor_pm25))
+        # Node attribute dicts and coordinates in a fixed order, so the dynamic
+        # pollen/wind passes can evaluate their predicates as array operations.
+        self._node_attrs: List[Dict[str, Any]] = [data for _, data in self.graph.nodes(data=True)]
+        self._node_lats = np.fromiter((float(data.get("y")) for data in self._node_attrs), dtype=np.float64, count=len(self._node_attrs))
+        self._node_lons = np.fromiter((float(data.get("x")) for data in self._node_attrs), dtype=np.float64, count=len(self._node_attrs))
+        if sensor_pm25:
+            node_pm25 = idw_many(
+                self._node_lats,
+                self._node_lons,
+                np.asarray(sensor_lats, dtype=np.float64),
+                np.asarray(sensor_lons, dtype=np.float64),
+                np.asarray(sensor_pm25, dtype=np.float64),
+            )
+        else:
+            node_pm25 = np.full(len(self._node_attrs), 12.0)
+        node_aqi = pm25_to_aqi_many(node_pm25)
+        node_pollution = np.minimum(node_aqi / 300.0, 1.5)
+        # Per-node cost factors as arrays (mirrored onto the node attributes) for
+        # the edge-cost pass; pollen and wind are updated per request.
+        self._node_factors: Dict[str, np.ndarray] = {
+            "pollution_factor": node_pollution,
+            "pollen_penalty_factor": np.zeros(len(self._node_attrs)),
+            "wind_adjustment_factor": np.zeros(len(self._node_attrs)),
+        }
+        for data, pm25, aqi, pollution_factor in zip(
+            self._node_attrs, node_pm25.tolist(), node_aqi.tolist(), node_pollution.tolist()
+        ):
             data["pm25"] = pm25
             data["aqi"] = aqi
             data["pollution_factor"] = pollution_factor
@@ -139,15 +234,31 @@ class SFRoutingEngine:
             data["pollen_penalty_factor"] = 0.0
             data["wind_adjustment_factor"] = 0.0
 
+        # Static per-edge terms as columns (endpoint node indices, length, grade
+        # penalty), so edge costs for all edges are one array expression.
+        node_index = {node_id: i for i, node_id in enumerate(self.graph.nodes)}
+        self._edge_attrs: List[Dict[str, Any]] = []
+        edge_u: List[int] = []
+        edge_v: List[int] = []
+        edge_distance: List[float] = []
+        edge_grade_penalty: List[float] = []
         for u, v, data in self.graph.edges(data=True):
-            distance = float(data.get("length") or 1.0)
             grade = abs(float(data.get("grade_abs", data.get("grade", 0.0)) or 0.0))
-            grade_penalty = 2.0 if grade > 0.05 else 0.0
-            node_u = self.graph.nodes[u]
-            node_v = self.graph.nodes[v]
-            pollution_factor = (node_u.get("pollution_factor", 0.0) + node_v.get("pollution_factor", 0.0)) / 2
-            # Base cost (will be adjusted dynamically for pollen/wind)
-            data["respiratory_cost"] = distance * (1 + pollution_factor + grade_penalty)
+            self._edge_attrs.append(data)
+            edge_u.append(node_index[u])
+            edge_v.append(node_index[v])
+            edge_distance.append(float(data.get("length") or 1.0))
+            edge_grade_penalty.append(2.0 if grade > 0.05 else 0.0)
+        self._edge_u = np.asarray(edge_u, dtype=np.intp)
+        self._edge_v = np.asarray(edge_v, dtype=np.intp)
+        self._edge_distance = np.asarray(edge_distance, dtype=np.float64)
+        self._edge_grade_penalty = np.asarray(edge_grade_penalty, dtype=np.float64)
+
+        # Base cost (will be adjusted dynamically for pollen/wind)
+        pollution_factor = (node_pollution[self._edge_u] + node_pollution[self._edge_v]) / 2
+        base_costs = self._edge_distance * (1 + pollution_factor + self._edge_grade_penalty)
+        for data, cost in zip(self._edge_attrs, base_costs.tolist()):
+            data["respiratory_cost"] = cost
 
     # ------------------------------------------------------------------
     # Public methods
@@ -241,28 +352,20 @@ class SFRoutingEngine:
         pollen_penalty = self.pollen_context.get("pollen_penalty", False)
         if not pollen_penalty:
             # Reset pollen penalties
-            for node_id, data in self.graph.nodes(data=True):
-                data["pollen_penalty_factor"] = 0.0
+            self._set_node_factors("pollen_penalty_factor", np.zeros(len(self._node_attrs)))
             return
         
         logger.info("Applying pollen penalty to park-adjacent nodes")
-        for node_id, data in self.graph.nodes(data=True):
-            lat = float(data.get("y"))
-            lon = float(data.get("x"))
-            
-            # Check distance to nearest park
-            min_park_distance = min(
-                haversine_distance(lat, lon, park_lat, park_lon)
-                for park_lat, park_lon in SF_PARKS
-            )
-            
-            # Apply penalty if within park radius
-            if min_park_distance < PARK_RADIUS_METERS:
-                # Penalty increases as you get closer to park center
-                penalty_factor = 0.5 * (1 - min_park_distance / PARK_RADIUS_METERS)
-                data["pollen_penalty_factor"] = penalty_factor
-            else:
-                data["pollen_penalty_factor"] = 0.0
+        # Distance from every node to its nearest park in one array pass
+        min_park_distance = _haversine_matrix(self._node_lats, self._node_lons, _PARK_LATS, _PARK_LONS).min(axis=1)
+        
+        # Apply penalty if within park radius; it increases closer to the park center
+        factors = np.where(
+            min_park_distance < PARK_RADIUS_METERS,
+            0.5 * (1 - min_park_distance / PARK_RADIUS_METERS),
+            0.0,
+        )
+        self._set_node_factors("pollen_penalty_factor", factors)
     
     def _apply_wind_breaker(self) -> None:
         """
@@ -273,8 +376,7 @@ class SFRoutingEngine:
         wind_direction = self.wind_context.get("direction_deg")
         if wind_direction is None:
             # Reset wind adjustments
-            for node_id, data in self.graph.nodes(data=True):
-                data["wind_adjustment_factor"] = 0.0
+            self._set_node_factors("wind_adjustment_factor", np.zeros(len(self._node_attrs)))
             return
         
         logger.info("Applying wind breaker adjustments for wind direction %.1f°", wind_direction)
@@ -288,51 +390,38 @@ class SFRoutingEngine:
         
         if not (is_westerly or is_easterly):
             # Neutral wind, no adjustment
-            for node_id, data in self.graph.nodes(data=True):
-                data["wind_adjustment_factor"] = 0.0
+            self._set_node_factors("wind_adjustment_factor", np.zeros(len(self._node_attrs)))
             return
         
-        # Apply cost reduction based on location relative to wind
-        for node_id, data in self.graph.nodes(data=True):
-            lon = float(data.get("x"))
-            
-            if is_westerly:
-                # Westerly wind: reduce cost for west-side nodes (lon < center)
-                if lon < SF_CENTER_LON:
-                    # Reduce cost by 25% for west-side nodes
-                    data["wind_adjustment_factor"] = -0.25
-                else:
-                    data["wind_adjustment_factor"] = 0.0
-            elif is_easterly:
-                # Easterly wind: reduce cost for east-side nodes (lon > center)
-                if lon > SF_CENTER_LON:
-                    # Reduce cost by 25% for east-side nodes
-                    data["wind_adjustment_factor"] = -0.25
-                else:
-                    data["wind_adjustment_factor"] = 0.0
+        # Reduce cost by 25% for nodes on the windward side (west for westerly, east for easterly)
+        if is_westerly:
+            windward = self._node_lons < SF_CENTER_LON
+        else:
+            windward = self._node_lons > SF_CENTER_LON
+        self._set_node_factors("wind_adjustment_factor", np.where(windward, -0.25, 0.0))
+    
+    def _set_node_factors(self, key: str, factors: np.ndarray) -> None:
+        """Store a dynamic per-node factor array and mirror it onto the node attributes."""
+        self._node_factors[key] = factors
+        for data, factor in zip(self._node_attrs, factors.tolist()):
+            data[key] = factor
     
     def _recompute_edge_costs(self) -> None:
         """
         Recompute edge costs with dynamic adjustments (pollen, wind).
         """
-        for u, v, data in self.graph.edges(data=True):
-            distance = float(data.get("length") or 1.0)
-            grade = abs(float(data.get("grade_abs", data.get("grade", 0.0)) or 0.0))
-            grade_penalty = 2.0 if grade > 0.05 else 0.0
-            
-            node_u = self.graph.nodes[u]
-            node_v = self.graph.nodes[v]
-            
-            # Average pollution factor
-            pollution_factor = (node_u.get("pollution_factor", 0.0) + node_v.get("pollution_factor", 0.0)) / 2
-            
-            # Average pollen penalty
-            pollen_penalty = (node_u.get("pollen_penalty_factor", 0.0) + node_v.get("pollen_penalty_factor", 0.0)) / 2
-            
-            # Average wind adjustment
-            wind_adjustment = (node_u.get("wind_adjustment_factor", 0.0) + node_v.get("wind_adjustment_factor", 0.0)) / 2
-            
-            # Apply wind adjustment as multiplier (negative adjustment = cost reduction)
-            base_cost = distance * (1 + pollution_factor + grade_penalty + pollen_penalty)
-            data["respiratory_cost"] = base_cost * (1 + wind_adjustment)
-
+        u = self._edge_u
+        v = self._edge_v
+        pollution = self._node_factors["pollution_factor"]
+        pollen = self._node_factors["pollen_penalty_factor"]
+        wind = self._node_factors["wind_adjustment_factor"]
+        # Average pollution factor, pollen penalty and wind adjustment per edge
+        pollution_factor = (pollution[u] + pollution[v]) / 2
+        pollen_penalty = (pollen[u] + pollen[v]) / 2
+        wind_adjustment = (wind[u] + wind[v]) / 2
+        
+        # Apply wind adjustment as multiplier (negative adjustment = cost reduction)
+        base_cost = self._edge_distance * (1 + pollution_factor + self._edge_grade_penalty + pollen_penalty)
+        costs = base_cost * (1 + wind_adjustment)
+        for data, cost in zip(self._edge_attrs, costs.tolist()):
+            data["respiratory_cost"] = cost
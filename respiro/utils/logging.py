@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Dict
@@ -21,8 +22,10 @@ class StructuredFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # record.created is captured by logging already; format it without a datetime object
+        created = record.created
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(created))}.{int(created % 1 * 1_000_000):06d}",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -48,23 +51,30 @@ class StructuredFormatter(logging.Formatter):
 
 
 class S3LogHandler(logging.Handler):
-    """Log handler that archives logs to S3."""
+    """Log handler that archives logs to S3 as gzip-compressed NDJSON batches."""
     
     def __init__(self, level=logging.INFO):
         super().__init__(level)
         # Lazy import to avoid circular dependency
         from respiro.storage.s3_client import get_s3_client
         self.s3_client = get_s3_client()
-        self.log_buffer = []
+        self.log_buffer = bytearray()
+        self.buffered_records = 0
         self.buffer_size = 100
+        self.flush_interval_seconds = 60.0
+        self._last_flush = time.monotonic()
     
     def emit(self, record: logging.LogRecord):
-        """Emit log record to buffer, flush to S3 when buffer is full."""
+        """Emit log record to buffer, flush to S3 when buffer is full or stale."""
         try:
-            log_entry = json.loads(self.format(record))
-            self.log_buffer.append(log_entry)
+            # The formatter already produces one JSON document per record
+            self.log_buffer += self.format(record).encode("utf-8") + b"\n"
+            self.buffered_records += 1
             
-            if len(self.log_buffer) >= self.buffer_size:
+            if (
+                self.buffered_records >= self.buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            ):
                 self.flush_to_s3()
         except Exception:
             # Don't let logging errors break the application
@@ -76,10 +86,12 @@ class S3LogHandler(logging.Handler):
             return
         
         try:
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            key = f"logs/application/{timestamp}.json"
-            self.s3_client.upload_json(key, {"logs": self.log_buffer})
-            self.log_buffer = []
+            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+            key = f"logs/application/{timestamp}.ndjson.gz"
+            self.s3_client.upload_ndjson_gzip(key, bytes(self.log_buffer))
+            self.log_buffer = bytearray()
+            self.buffered_records = 0
+            self._last_flush = time.monotonic()
         except Exception as e:
             # Log to stderr if S3 upload fails
             print(f"Failed to flush logs to S3: {e}", file=sys.stderr)
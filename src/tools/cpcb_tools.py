@@ -1,32 +1,74 @@
 import pandas as pd
 import io
 import os
+import httpx
 from src.utils.api_helpers import make_api_request
 
 
+CPCB_URL = "https://api.data.gov.in/resource/3b01bcb8-0b14-4abf-b6f2-c1bfd384ba69"
+
+# Low-cardinality text columns (a few dozen distinct values across ~2000 rows)
+CATEGORICAL_COLUMNS = ("state", "city", "station", "pollutant_id")
+
+
+def _cpcb_params(api_key):
+    return {
+        'api-key': api_key,
+        'format': 'csv',
+        'limit': 2000
+    }
+
+
+def _read_cpcb_csv(content):
+    # Hand the raw bytes to the C parser; response.text would first run
+    # requests' charset detection and build a full Python str copy.
+    df = pd.read_csv(io.BytesIO(content), encoding="utf-8")
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
 def fetch_cpcb_data():
     """Fetch air quality data from CPCB API"""
     # Get API key from environment variable
     api_key = os.getenv('CPCB_API_KEY')
-    
+
     if not api_key:
         print("Error: CPCB_API_KEY environment variable not found")
         return pd.DataFrame()
-    
-    # Build the request URL
-    url = "https://api.data.gov.in/resource/3b01bcb8-0b14-4abf-b6f2-c1bfd384ba69"
-    params = {
-        'api-key': api_key,
-        'format': 'csv',
-        'limit': 2000
-    }
-    
+
     # Make the API request using helper function
-    response = make_api_request(url, params=params)
-    
+    response = make_api_request(CPCB_URL, params=_cpcb_params(api_key))
+
     if response:
         # Read CSV data from response text
-        df = pd.read_csv(io.StringIO(response.text))
-        return df
+        return _read_cpcb_csv(response.content)
     else:
         return pd.DataFrame()
+
+
+async def fetch_cpcb_data_async(client=None):
+    """Fetch CPCB data without blocking the event loop.
+
+    Pass a shared ``httpx.AsyncClient`` so the CPCB, NASA and DSS fetches can
+    be awaited together with ``asyncio.gather`` over one connection pool.
+    """
+    api_key = os.getenv('CPCB_API_KEY')
+
+    if not api_key:
+        print("Error: CPCB_API_KEY environment variable not found")
+        return pd.DataFrame()
+
+    if client is None:
+        async with httpx.AsyncClient(timeout=30) as own_client:
+            return await fetch_cpcb_data_async(own_client)
+
+    try:
+        response = await client.get(CPCB_URL, params=_cpcb_params(api_key))
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"Error: CPCB request failed: {e}")
+        return pd.DataFrame()
+
+    return _read_cpcb_csv(response.content)
@@ -1,26 +1,35 @@
 import pandas as pd
-import io
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import os
 from src.utils.api_helpers import make_api_request
 
 
+# Keep acq_date as text (pyarrow would otherwise infer date32), matching pandas.read_csv
+_FIRMS_CONVERT_OPTIONS = pacsv.ConvertOptions(column_types={"acq_date": pa.string()})
+
+
+def _read_firms_csv(content):
+    # Multi-threaded C++ parse straight from the response bytes
+    table = pacsv.read_csv(pa.py_buffer(content), convert_options=_FIRMS_CONVERT_OPTIONS)
+    return table.to_pandas()
+
+
 def fetch_nasa_fire_data():
     # Get the API key from environment variable
     api_key = os.getenv('NASA_MAP_KEY')
-    
+
     if not api_key:
         print("Error: NASA_MAP_KEY environment variable not found")
         return pd.DataFrame()
-    
+
     # Build the request URL
     url = f'https://firms.modaps.eosdis.nasa.gov/api/area/csv/{api_key}/VIIRS_SNPP/world/1'
-    
+
     # Make the API request using helper function
     response = make_api_request(url)
-    
+
     if response:
-        # Use pandas to read the CSV data
-        df = pd.read_csv(io.StringIO(response.text))
-        return df
+        return _read_firms_csv(response.content)
     else:
         return pd.DataFrame()
@@ -12,10 +12,12 @@ import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from pathlib import Path
 
+import orjson
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,12 @@ except ImportError:
     logger.warning("boto3 library not available, AWS services will use mock")
 
 
+# Keep-alive session for SendGrid/Twilio/FCM POSTs. Its default adapter does not
+# retry, since the provider may already have accepted a message and a re-send
+# would deliver it twice.
+_http_session = requests.Session() if REQUESTS_AVAILABLE else None
+
+
 class NotificationService:
     """Notification service with real API implementations and graceful fallback."""
     
@@ -43,6 +51,8 @@ class NotificationService:
         self.notification_history: list[dict[str, Any]] = []
         self.history_file = Path(__file__).parent.parent / "notification_history.json"
         self._load_history()
+        # boto3 clients by (service, region), built on first send and reused
+        self._aws_clients: dict[tuple[str, str], Any] = {}
         
         # Email service configuration
         self.email_service_type = os.getenv("EMAIL_SERVICE_TYPE", "mock").lower()
@@ -160,6 +170,20 @@ class NotificationService:
         
         raise last_exception
     
+    def _get_aws_client(self, service: str, region: str) -> Any:
+        """Return a cached boto3 client so credentials and endpoints resolve once."""
+        key = (service, region)
+        client = self._aws_clients.get(key)
+        if client is None:
+            client = boto3.client(
+                service,
+                region_name=region,
+                aws_access_key_id=self.aws_access_key,
+                aws_secret_access_key=self.aws_secret_key
+            )
+            self._aws_clients[key] = client
+        return client
+    
     def _load_history(self) -> None:
         """Load notification history from file."""
         if self.history_file.exists():
@@ -183,11 +207,12 @@ class NotificationService:
         recipient: str,
         subject: str | None,
         message: str,
-        status: str = "sent"
+        status: str = "sent",
+        timestamp: str | None = None
     ) -> None:
         """Add notification to history."""
         entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
             "type": notification_type,
             "recipient": recipient,
             "subject": subject,
@@ -195,9 +220,9 @@ class NotificationService:
             "status": status
         }
         self.notification_history.append(entry)
-        # Keep only last 1000 entries
+        # Keep only last 1000 entries (trimmed in place, no slice copy)
         if len(self.notification_history) > 1000:
-            self.notification_history = self.notification_history[-1000:]
+            del self.notification_history[:-1000]
         self._save_history()
     
     def send_email(
@@ -245,6 +270,8 @@ class NotificationService:
         from_email: str
     ) -> dict[str, Any]:
         """Send email via SMTP."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
         def _send():
             msg = MIMEMultipart()
             msg["From"] = from_email
@@ -266,12 +293,12 @@ class NotificationService:
                 "recipients": recipients,
                 "subject": subject,
                 "mode": "real",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
         
         result = self._retry_with_backoff(_send)
         for recipient in recipients:
-            self._add_to_history("email", recipient, subject, body, "sent")
+            self._add_to_history("email", recipient, subject, body, "sent", timestamp)
         return result
     
     def _real_send_email_sendgrid(
@@ -282,36 +309,38 @@ class NotificationService:
         from_email: str
     ) -> dict[str, Any]:
         """Send email via SendGrid API."""
-        def _send():
-            url = "https://api.sendgrid.com/v3/mail/send"
-            headers = {
-                "Authorization": f"Bearer {self.sendgrid_api_key}",
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "personalizations": [{"to": [{"email": r} for r in recipients]}],
-                "from": {"email": from_email},
-                "subject": subject,
-                "content": [{"type": "text/plain", "value": body}]
-            }
-            
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            logger.info(f"[NotificationService] Email sent via SendGrid to {len(recipients)} recipients")
-            return {
-                "status": "success",
-                "type": "email",
-                "service": "sendgrid",
-                "recipients": recipients,
-                "subject": subject,
-                "mode": "real",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        url = "https://api.sendgrid.com/v3/mail/send"
+        headers = {
+            "Authorization": f"Bearer {self.sendgrid_api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "personalizations": [{"to": [{"email": r} for r in recipients]}],
+            "from": {"email": from_email},
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": body}]
+        }
+        
+        response = _http_session.post(
+            url, headers=headers, data=orjson.dumps(payload), timeout=30
+        )
+        response.raise_for_status()
+        
+        logger.info(f"[NotificationService] Email sent via SendGrid to {len(recipients)} recipients")
+        result = {
+            "status": "success",
+            "type": "email",
+            "service": "sendgrid",
+            "recipients": recipients,
+            "subject": subject,
+            "mode": "real",
+            "timestamp": timestamp
+        }
         
-        result = self._retry_with_backoff(_send)
         for recipient in recipients:
-            self._add_to_history("email", recipient, subject, body, "sent")
+            self._add_to_history("email", recipient, subject, body, "sent", timestamp)
         return result
     
     def _real_send_email_ses(
@@ -322,13 +351,10 @@ class NotificationService:
         from_email: str
     ) -> dict[str, Any]:
         """Send email via AWS SES."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
         def _send():
-            ses_client = boto3.client(
-                "ses",
-                region_name=self.ses_region,
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key
-            )
+            ses_client = self._get_aws_client("ses", self.ses_region)
             
             response = ses_client.send_email(
                 Source=from_email,
@@ -348,12 +374,12 @@ class NotificationService:
                 "subject": subject,
                 "mode": "real",
                 "message_id": response["MessageId"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
         
         result = self._retry_with_backoff(_send)
         for recipient in recipients:
-            self._add_to_history("email", recipient, subject, body, "sent")
+            self._add_to_history("email", recipient, subject, body, "sent", timestamp)
         return result
     
     def _mock_send_email(
@@ -364,11 +390,17 @@ class NotificationService:
         from_email: str
     ) -> dict[str, Any]:
         """Mock email implementation."""
-        logger.info(f"[NotificationService] EMAIL (mock): To {', '.join(recipients)}")
-        logger.info(f"[NotificationService] Subject: {subject}")
+        timestamp = datetime.now(timezone.utc).isoformat()
+        # The recipient join is only worth building when INFO is actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[NotificationService] EMAIL (mock): to=%s subject=%s",
+                ', '.join(recipients),
+                subject,
+            )
         
         for recipient in recipients:
-            self._add_to_history("email", recipient, subject, body, "sent")
+            self._add_to_history("email", recipient, subject, body, "sent", timestamp)
         
         return {
             "status": "success",
@@ -376,7 +408,7 @@ class NotificationService:
             "recipients": recipients,
             "subject": subject,
             "mode": "mock",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
     
     def send_sms(
@@ -414,36 +446,36 @@ class NotificationService:
         phone_numbers: list[str]
     ) -> dict[str, Any]:
         """Send SMS via Twilio API."""
-        def _send():
-            url = f"https://api.twilio.com/2010-04-01/Accounts/{self.twilio_account_sid}/Messages.json"
-            auth = (self.twilio_account_sid, self.twilio_auth_token)
-            
-            results = []
-            for phone in phone_numbers:
-                payload = {
-                    "From": self.twilio_from_number,
-                    "To": phone,
-                    "Body": message
-                }
-                response = requests.post(url, auth=auth, data=payload, timeout=30)
-                response.raise_for_status()
-                results.append(response.json()["sid"])
-            
-            logger.info(f"[NotificationService] SMS sent via Twilio to {len(phone_numbers)} recipients")
-            return {
-                "status": "success",
-                "type": "sms",
-                "service": "twilio",
-                "recipients": phone_numbers,
-                "message": message,
-                "mode": "real",
-                "message_sids": results,
-                "timestamp": datetime.utcnow().isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        url = f"https://api.twilio.com/2010-04-01/Accounts/{self.twilio_account_sid}/Messages.json"
+        auth = (self.twilio_account_sid, self.twilio_auth_token)
+        
+        results = []
+        for phone in phone_numbers:
+            payload = {
+                "From": self.twilio_from_number,
+                "To": phone,
+                "Body": message
             }
+            response = _http_session.post(url, auth=auth, data=payload, timeout=30)
+            response.raise_for_status()
+            results.append(orjson.loads(response.content)["sid"])
+        
+        logger.info(f"[NotificationService] SMS sent via Twilio to {len(phone_numbers)} recipients")
+        result = {
+            "status": "success",
+            "type": "sms",
+            "service": "twilio",
+            "recipients": phone_numbers,
+            "message": message,
+            "mode": "real",
+            "message_sids": results,
+            "timestamp": timestamp
+        }
         
-        result = self._retry_with_backoff(_send)
         for phone in phone_numbers:
-            self._add_to_history("sms", phone, None, message, "sent")
+            self._add_to_history("sms", phone, None, message, "sent", timestamp)
         return result
     
     def _real_send_sms_sns(
@@ -452,13 +484,10 @@ class NotificationService:
         phone_numbers: list[str]
     ) -> dict[str, Any]:
         """Send SMS via AWS SNS."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
         def _send():
-            sns_client = boto3.client(
-                "sns",
-                region_name=self.sns_region,
-                aws_access_key_id=self.aws_access_key,
-                aws_secret_access_key=self.aws_secret_key
-            )
+            sns_client = self._get_aws_client("sns", self.sns_region)
             
             results = []
             for phone in phone_numbers:
@@ -474,12 +503,12 @@ class NotificationService:
                 "message": message,
                 "mode": "real",
                 "message_ids": results,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
         
         result = self._retry_with_backoff(_send)
         for phone in phone_numbers:
-            self._add_to_history("sms", phone, None, message, "sent")
+            self._add_to_history("sms", phone, None, message, "sent", timestamp)
         return result
     
     def _mock_send_sms(
@@ -488,11 +517,16 @@ class NotificationService:
         phone_numbers: list[str]
     ) -> dict[str, Any]:
         """Mock SMS implementation."""
-        logger.info(f"[NotificationService] SMS (mock): To {', '.join(phone_numbers)}")
-        logger.info(f"[NotificationService] Message: {message[:100]}...")
+        timestamp = datetime.now(timezone.utc).isoformat()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[NotificationService] SMS (mock): to=%s message=%s...",
+                ', '.join(phone_numbers),
+                message[:100],
+            )
         
         for phone in phone_numbers:
-            self._add_to_history("sms", phone, None, message, "sent")
+            self._add_to_history("sms", phone, None, message, "sent", timestamp)
         
         return {
             "status": "success",
@@ -500,7 +534,7 @@ class NotificationService:
             "recipients": phone_numbers,
             "message": message,
             "mode": "mock",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
     
     def send_push_notification(
@@ -545,41 +579,43 @@ class NotificationService:
         users: list[str]
     ) -> dict[str, Any]:
         """Send push notification via Firebase Cloud Messaging."""
-        def _send():
-            url = "https://fcm.googleapis.com/fcm/send"
-            headers = {
-                "Authorization": f"key={self.fcm_server_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Note: In production, you'd need to map user IDs to FCM tokens
-            # This is a simplified implementation
-            payload = {
-                "notification": {
-                    "title": title,
-                    "body": message
-                },
-                "registration_ids": users  # In production, these would be FCM tokens
-            }
-            
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            logger.info(f"[NotificationService] Push notification sent via FCM to {len(users)} users")
-            return {
-                "status": "success",
-                "type": "push",
-                "service": "fcm",
-                "recipients": users,
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        url = "https://fcm.googleapis.com/fcm/send"
+        headers = {
+            "Authorization": f"key={self.fcm_server_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Note: In production, you'd need to map user IDs to FCM tokens
+        # This is a simplified implementation
+        payload = {
+            "notification": {
                 "title": title,
-                "message": message,
-                "mode": "real",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+                "body": message
+            },
+            "registration_ids": users  # In production, these would be FCM tokens
+        }
+        
+        response = _http_session.post(
+            url, headers=headers, data=orjson.dumps(payload), timeout=30
+        )
+        response.raise_for_status()
+        
+        logger.info(f"[NotificationService] Push notification sent via FCM to {len(users)} users")
+        result = {
+            "status": "success",
+            "type": "push",
+            "service": "fcm",
+            "recipients": users,
+            "title": title,
+            "message": message,
+            "mode": "real",
+            "timestamp": timestamp
+        }
         
-        result = self._retry_with_backoff(_send)
         for user in users:
-            self._add_to_history("push", user, title, message, "sent")
+            self._add_to_history("push", user, title, message, "sent", timestamp)
         return result
     
     def _real_send_push_apns(
@@ -613,12 +649,17 @@ class NotificationService:
         users: list[str]
     ) -> dict[str, Any]:
         """Mock push notification implementation."""
-        logger.info(f"[NotificationService] PUSH (mock): To {', '.join(users)}")
-        logger.info(f"[NotificationService] Title: {title}")
-        logger.info(f"[NotificationService] Message: {message[:100]}...")
+        timestamp = datetime.now(timezone.utc).isoformat()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[NotificationService] PUSH (mock): to=%s title=%s message=%s...",
+                ', '.join(users),
+                title,
+                message[:100],
+            )
         
         for user in users:
-            self._add_to_history("push", user, title, message, "sent")
+            self._add_to_history("push", user, title, message, "sent", timestamp)
         
         return {
             "status": "success",
@@ -627,7 +668,7 @@ class NotificationService:
             "title": title,
             "message": message,
             "mode": "mock",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
     
     def get_history(
@@ -645,13 +686,14 @@ class NotificationService:
         Returns:
             List of notification entries
         """
-        history = self.notification_history.copy()
+        # Filtering and slicing both build new lists, so no defensive copy is needed
+        history = self.notification_history
         
         if notification_type:
             history = [h for h in history if h.get("type") == notification_type]
         
         # Return most recent first
-        return list(reversed(history[-limit:]))
+        return history[-limit:][::-1]
     
     def clear_history(self) -> None:
         """Clear notification history."""
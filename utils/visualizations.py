@@ -6,6 +6,7 @@ Provides pollution drift animations, heat maps, and time-lapse visualizations.
 
 import math
 from typing import Any
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -59,25 +60,22 @@ def create_pollution_drift_animation(
     # Convert wind direction to radians (adjust for map orientation)
     wind_rad = math.radians(wind_direction - 90)
     
+    # Drift endpoints for every frame (every 2 hours) in one vectorized pass:
+    # drift distance scales with hours, converted to degrees (1 degree ≈ 111 km)
+    frame_hours = np.arange(0, hours, 2)
+    drift_deg = wind_speed * (frame_hours / 24.0) / 111.0
+    drift_lats = (delhi_center[0] + drift_deg * math.cos(wind_rad)).tolist()
+    drift_lons = (delhi_center[1] + drift_deg * math.sin(wind_rad)).tolist()
+    
+    # Fire positions are the same in every frame
+    fire_lats = fire_data["lat"].tolist() if not fire_data.empty and "lat" in fire_data.columns else []
+    fire_lons = fire_data["lon"].tolist() if not fire_data.empty and "lon" in fire_data.columns else []
+    
     # Create frames for animation
     frames = []
     steps = []
     
-    for hour in range(0, hours, 2):  # Every 2 hours
-        # Calculate drift distance (km per hour)
-        drift_distance_km = wind_speed * (hour / 24.0)  # Scale by hours
-        
-        # Convert km to degrees (approximate: 1 degree ≈ 111 km)
-        drift_deg = drift_distance_km / 111.0
-        
-        # Calculate drift endpoint
-        drift_lat = delhi_center[0] + drift_deg * math.cos(wind_rad)
-        drift_lon = delhi_center[1] + drift_deg * math.sin(wind_rad)
-        
-        # Create scatter plot for fires
-        fire_lats = fire_data["lat"].tolist() if not fire_data.empty and "lat" in fire_data.columns else []
-        fire_lons = fire_data["lon"].tolist() if not fire_data.empty and "lon" in fire_data.columns else []
-        
+    for hour, drift_lat, drift_lon in zip(frame_hours.tolist(), drift_lats, drift_lons):
         # Create frame
         frame_data = [
             go.Scattergeo(
@@ -112,17 +110,13 @@ def create_pollution_drift_animation(
                     "transition": {"duration": 300}
                 }
             ]
-        )
-    
-    # Initial data
-    initial_fire_lats = fire_data["lat"].tolist() if not fire_data.empty and "lat" in fire_data.columns else []
-    initial_fire_lons = fire_data["lon"].tolist() if not fire_data.empty and "lon" in fire_data.columns else []
+        })
     
     fig = go.Figure(
         data=[
             go.Scattergeo(
-                lon=initial_fire_lons,
-                lat=initial_fire_lats,
+                lon=fire_lons,
+                lat=fire_lats,
                 mode="markers",
                 marker=dict(
                     size=12, 
@@ -131,7 +125,7 @@ def create_pollution_drift_animation(
                     line=dict(width=2, color="white")
                 ),
                 name="Farm Fires",
-                text=[f"Fire {i+1}" for i in range(len(initial_fire_lons))],
+                text=[f"Fire {i+1}" for i in range(len(fire_lons))],
                 hovertemplate="<b>%{text}</b><br>Lat: %{lat:.4f}<br>Lon: %{lon:.4f}<extra></extra>"
             )
         ],
@@ -232,17 +226,20 @@ def create_aqi_heatmap(
     if aqi_data.empty or "lat" not in aqi_data.columns or "lon" not in aqi_data.columns:
         return m
     
+    # Column-wise validity masks instead of a pd.notna call per cell per row
+    lats = aqi_data["lat"]
+    lons = aqi_data["lon"]
+    values = aqi_data["value"] if "value" in aqi_data.columns else pd.Series(0, index=aqi_data.index)
+    located = lats.notna() & lons.notna()
+    
     # Prepare heat map data
-    heat_data = []
-    for idx, row in aqi_data.iterrows():
-        lat = row.get("lat")
-        lon = row.get("lon")
-        value = row.get("value", 0)
-        
-        if pd.notna(lat) and pd.notna(lon) and value > 0:
-            # Weight by AQI value (higher AQI = more intense)
-            weight = min(1.0, value / 500.0)  # Normalize to 0-1
-            heat_data.append([lat, lon, weight])
+    heat_mask = located & (values > 0)
+    # Weight by AQI value (higher AQI = more intense), normalized to 0-1
+    weights = np.minimum(1.0, values[heat_mask] / 500.0)
+    heat_data = [
+        [lat, lon, weight]
+        for lat, lon, weight in zip(lats[heat_mask].tolist(), lons[heat_mask].tolist(), weights.tolist())
+    ]
     
     if heat_data:
         # Add heat map layer
@@ -263,49 +260,44 @@ def create_aqi_heatmap(
         ).add_to(m)
     
     # Add markers for AQI stations
-    for idx, row in aqi_data.iterrows():
-        lat = row.get("lat")
-        lon = row.get("lon")
-        value = row.get("value", 0)
+    for lat, lon, value in zip(lats[located].tolist(), lons[located].tolist(), values[located].tolist()):
+        # Determine color based on AQI (consistent with dashboard theme)
+        if value > 400:
+            color = "#b91c1c"  # Severe - Dark red
+        elif value > 300:
+            color = "#ef4444"  # Very Poor - Red
+        elif value > 200:
+            color = "#f97316"  # Poor - Orange
+        elif value > 100:
+            color = "#eab308"  # Moderate - Yellow
+        else:
+            color = "#22c55e"  # Satisfactory - Green
         
-        if pd.notna(lat) and pd.notna(lon):
-            # Determine color based on AQI (consistent with dashboard theme)
-            if value > 400:
-                color = "#b91c1c"  # Severe - Dark red
-            elif value > 300:
-                color = "#ef4444"  # Very Poor - Red
-            elif value > 200:
-                color = "#f97316"  # Poor - Orange
-            elif value > 100:
-                color = "#eab308"  # Moderate - Yellow
-            else:
-                color = "#22c55e"  # Satisfactory - Green
-            
-            # Enhanced popup
-            popup_html = f"""
-            <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; 
-                        width: 180px; padding: 8px;">
-                <div style="border-left: 4px solid {color}; padding-left: 8px;">
-                    <h4 style="margin: 0 0 4px 0; color: {color}; font-size: 14px; font-weight: 600;">
-                        🌡️ AQI Station
-                    </h4>
-                    <p style="margin: 0; font-size: 18px; font-weight: 700; color: {color};">
-                        {value:.0f}
-                    </p>
-                </div>
+        # Enhanced popup
+        popup_html = f"""
+        <div style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; 
+                    width: 180px; padding: 8px;">
+            <div style="border-left: 4px solid {color}; padding-left: 8px;">
+                <h4 style="margin: 0 0 4px 0; color: {color}; font-size: 14px; font-weight: 600;">
+                    🌡️ AQI Station
+                </h4>
+                <p style="margin: 0; font-size: 18px; font-weight: 700; color: {color};">
+                    {value:.0f}
+                </p>
             </div>
-            """
-            
-            folium.CircleMarker(
-                location=[lat, lon],
-                radius=max(6, min(20, 6 + (value / 30))),
-                popup=folium.Popup(popup_html, max_width=200),
-                color='white',
-                fillColor=color,
-                fillOpacity=0.8,
-                weight=3
-            ).add_to(m)
-    
+        </div>
+        """
+        
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=max(6, min(20, 6 + (value / 30))),
+            popup=folium.Popup(popup_html, max_width=200),
+            color='white',
+            fillColor=color,
+            fillOpacity=0.8,
+            weight=3
+        ).add_to(m)
+
     return m
 
 